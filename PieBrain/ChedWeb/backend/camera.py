@@ -1,10 +1,14 @@
 """Camera video streaming module using picamera2 and aiortc."""
 
 import asyncio
+import fractions
+import os
+import queue
+import threading
 import time
-from typing import Optional
+import weakref
+from typing import Optional, Union
 
-import av
 import numpy as np
 from aiortc import VideoStreamTrack
 from aiortc.mediastreams import MediaStreamError
@@ -12,9 +16,10 @@ from av import VideoFrame
 from loguru import logger
 
 import metrics
+from yuv_convert import LIBYUV_AVAILABLE, bgr24_to_i420
 
 try:
-    from picamera2 import Picamera2
+    from picamera2 import MappedArray, Picamera2
     import libcamera
 
     PICAMERA2_AVAILABLE = True
@@ -24,6 +29,85 @@ except ImportError:
     libcamera = None  # type: ignore
 
 
+# Frames handed to aiortc are recycled from a small pool: one being encoded,
+# one waiting for recv(), and one being filled by the capture thread. The
+# sender encodes a frame before it asks for the next one, so three slots
+# guarantee we never write into a frame that is still being encoded.
+FRAME_POOL_SIZE = 3
+
+# Number of frames per FPS measurement window
+FPS_WINDOW_FRAMES = 30
+
+# Window in which CameraManager merges settings updates into one set_controls call
+SETTINGS_DEBOUNCE_S = 0.03
+
+# Every encoder aiortc drives wants planar YUV 4:2:0, so the camera emits it
+# natively and the ISP does the colour conversion instead of the CPU.
+CAMERA_FORMAT = "YUV420"
+FRAME_FORMAT = "yuv420p"
+# Used only if the camera rejects YUV420. Frames are then converted to yuv420p
+# with libyuv when it's installed, or passed to the encoder as BGR otherwise.
+CAMERA_FALLBACK_FORMAT = "RGB888"
+
+
+def _rgb_to_yuv(rgb: tuple[int, int, int]) -> tuple[int, int, int]:
+    """Convert an 8-bit RGB colour to limited-range BT.601 YUV."""
+    r, g, b = rgb
+    y = 16 + (65.738 * r + 129.057 * g + 25.064 * b) / 256
+    u = 128 + (-37.945 * r - 74.494 * g + 112.439 * b) / 256
+    v = 128 + (112.439 * r - 94.154 * g - 18.285 * b) / 256
+    return round(y), round(u), round(v)
+
+
+# Mock test pattern colours, converted to YUV once at import.
+MOCK_BAR_COLORS = [
+    (255, 255, 255),  # White
+    (255, 255, 0),  # Yellow
+    (0, 255, 255),  # Cyan
+    (0, 255, 0),  # Green
+    (255, 0, 255),  # Magenta
+    (255, 0, 0),  # Red
+    (0, 0, 255),  # Blue
+    (0, 0, 0),  # Black
+]
+_MOCK_PALETTE = np.array([_rgb_to_yuv(color) for color in MOCK_BAR_COLORS], dtype=np.uint8)
+_MOCK_COUNTER_YUV = _rgb_to_yuv((50, 50, 50))
+
+# libcamera AWB modes are set by index, not enum
+_AWB_INDEX: dict[str, int] = {
+    "auto": 0,
+    "incandescent": 1,
+    "tungsten": 2,
+    "fluorescent": 3,
+    "indoor": 4,
+    "daylight": 5,
+    "cloudy": 6,
+    "greyworld": 0,  # Use auto mode as fallback for greyworld
+}
+
+
+def _plane_views(frame: VideoFrame) -> tuple[np.ndarray, ...]:
+    """Return writable ``(rows, line_size)`` views over each plane of ``frame``.
+
+    The views alias the frame's own buffers, so for a frame that is reused
+    they can be built once and written into directly every frame without
+    going back through PyAV.
+    """
+    return tuple(
+        np.frombuffer(plane, dtype=np.uint8).reshape(plane.height, plane.line_size)
+        for plane in frame.planes
+    )
+
+
+def _copy_into_plane(dst: np.ndarray, src: np.ndarray) -> None:
+    """Copy a (rows, row_bytes) uint8 image into a plane view.
+
+    The plane's line stride may be padded past the visible width, so only
+    the leading ``row_bytes`` of each line are written.
+    """
+    dst[:, : src.shape[1]] = src
+
+
 class PiCameraVideoTrack(VideoStreamTrack):
     """
     VideoStreamTrack implementation using Raspberry Pi camera (picamera2).
@@ -42,6 +126,7 @@ class PiCameraVideoTrack(VideoStreamTrack):
         is_noir: bool = True,
         awb_mode: str = "manual",
         color_gains: tuple[float, float] = (2.0, 1.2),
+        capture_cpus: Optional[set[int]] = None,
     ) -> None:
         """
         Initialize the Pi camera video track.
@@ -55,21 +140,82 @@ class PiCameraVideoTrack(VideoStreamTrack):
             is_noir: If True, apply color correction for NoIR (No IR filter) camera
             awb_mode: Auto white balance mode (auto, greyworld, daylight, etc.)
             color_gains: Manual color gains (red, blue) - only used if awb_mode is None
+            capture_cpus: CPU cores to pin the capture thread to (Linux only)
         """
         super().__init__()
         self.width = width
         self.height = height
         self.framerate = framerate
+        # Mock frames are stamped in 1/framerate units
+        self._time_base = fractions.Fraction(1, framerate)
         self.flip_180 = flip_180
         self.use_mock = use_mock or not PICAMERA2_AVAILABLE
         self.is_noir = is_noir
         self.awb_mode = awb_mode
         self.color_gains = color_gains
+        self.capture_cpus = capture_cpus
 
         self.camera: Optional[Picamera2] = None
+        self._mock_frame: Optional[VideoFrame] = None
+        # Capture thread state (real camera only). The thread fills frames from
+        # _free_frames and hands them to recv() through the one-slot _frames
+        # queue, dropping a frame recv() hasn't collected yet.
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._frames: Optional[asyncio.Queue[Union[VideoFrame, Exception]]] = None
+        self._free_frames: queue.SimpleQueue[VideoFrame] = queue.SimpleQueue()
+        self._frame_views: dict[int, tuple[np.ndarray, ...]] = {}
+        self._frame_format = FRAME_FORMAT
+        # The plain function, called with self: a bound method stored on the
+        # instance would be a reference cycle keeping a dropped track alive.
+        self._convert_frame = PiCameraVideoTrack._copy_yuv420
+        self._in_flight: Optional[VideoFrame] = None
+        self._capture_stop = threading.Event()
+        self._capture_thread: Optional[threading.Thread] = None
         self._frame_count = 0
-        self._start_time = time.time()
+        # FPS is measured over a sliding window of frames on the monotonic
+        # clock, so NTP steps can't skew it and it tracks the current rate.
+        self._fps_window_start = time.monotonic()
+        self._fps_window_frames = 0
+        self._actual_fps = 0.0
         self._is_running = False
+        # Set by the first recv(), which starts the camera
+        self._initialized = False
+
+    @property
+    def awb_mode(self) -> str:
+        """Auto white balance mode as configured."""
+        return self._awb_mode
+
+    @awb_mode.setter
+    def awb_mode(self, value: str) -> None:
+        # Cache the lookup key so building controls does no string work
+        self._awb_mode = value
+        self._awb_key = value.lower() if value else ""
+
+    def _build_controls(self, framerate: Optional[int] = None) -> dict:
+        """
+        Build the libcamera controls for the current white balance settings.
+
+        Args:
+            framerate: Also set FrameRate when given
+
+        Returns:
+            Controls dict for create_video_configuration() or set_controls()
+        """
+        if self._awb_key and self._awb_key != "manual":
+            awb_index = _AWB_INDEX.get(self._awb_key)
+            if awb_index is None:
+                logger.warning("Unknown AWB mode: {}, using Auto", self.awb_mode)
+                awb_index = _AWB_INDEX["auto"]
+            controls = {"AwbEnable": True, "AwbMode": awb_index}
+        else:
+            # Manual color gains
+            controls = {"AwbEnable": False, "ColourGains": self.color_gains}
+
+        if framerate is not None:
+            controls["FrameRate"] = framerate
+
+        return controls
 
     def _init_camera(self) -> None:
         """Initialize the Picamera2 instance with configuration."""
@@ -83,105 +229,220 @@ class PiCameraVideoTrack(VideoStreamTrack):
 
         try:
             logger.info(
-                f"Initializing Pi camera: {self.width}x{self.height}@{self.framerate}fps, flip_180={self.flip_180}"
+                "Initializing Pi camera: {}x{}@{}fps, flip_180={}",
+                self.width,
+                self.height,
+                self.framerate,
+                self.flip_180,
             )
 
             self.camera = Picamera2()
 
-            # Build controls dictionary
-            controls = {"FrameRate": self.framerate}
-
-            if self.awb_mode and self.awb_mode.lower() != "manual":
-                # AWB modes are set by index, not enum
-                awb_mode_index = {
-                    "auto": 0,
-                    "incandescent": 1,
-                    "tungsten": 2,
-                    "fluorescent": 3,
-                    "indoor": 4,
-                    "daylight": 5,
-                    "cloudy": 6,
-                    "greyworld": 0,  # Use auto mode as fallback for greyworld
-                }
-
-                if self.awb_mode.lower() in awb_mode_index:
-                    controls["AwbEnable"] = True
-                    controls["AwbMode"] = awb_mode_index[self.awb_mode.lower()]
-                    logger.info(
-                        f"Using AWB mode: {self.awb_mode} (index {awb_mode_index[self.awb_mode.lower()]})"
-                    )
-                else:
-                    logger.warning(f"Unknown AWB mode: {self.awb_mode}, using Auto")
-                    controls["AwbEnable"] = True
-                    controls["AwbMode"] = 0
+            controls = self._build_controls(framerate=self.framerate)
+            if controls["AwbEnable"]:
+                logger.info("Using AWB mode: {} (index {})", self.awb_mode, controls["AwbMode"])
             else:
-                # Manual color gains
-                controls["AwbEnable"] = False
-                controls["ColourGains"] = self.color_gains
-                logger.info(
-                    f"Using manual color gains: {self.color_gains}"
-                )  # Configure camera for video streaming
-            video_config = self.camera.create_video_configuration(
-                main={"size": (self.width, self.height), "format": "RGB888"},
-                controls=controls,
-            )
+                logger.info("Using manual color gains: {}", self.color_gains)
 
-            # Flip camera 180 degrees if needed (for upside-down mounting)
-            if self.flip_180:
-                video_config["transform"] = libcamera.Transform(hflip=1, vflip=1)
+            # Configure camera for video streaming
+            try:
+                self._configure_camera(CAMERA_FORMAT, controls)
+            except Exception as e:
+                logger.warning(
+                    "Camera rejected {} output ({}), falling back to {}",
+                    CAMERA_FORMAT,
+                    e,
+                    CAMERA_FALLBACK_FORMAT,
+                )
+                self._configure_camera(CAMERA_FALLBACK_FORMAT, controls)
 
-            self.camera.configure(video_config)
             self.camera.start()
 
+            self._start_capture_thread()
+
             logger.info("Pi camera initialized successfully")
             self._is_running = True
 
         except Exception as e:
-            logger.error(f"Failed to initialize camera: {e}")
+            logger.error("Failed to initialize camera: {}", e)
             self.use_mock = True
             logger.info("Falling back to mock video source")
 
-    def _generate_mock_frame(self) -> VideoFrame:
-        """Generate a test pattern frame for mock mode."""
-        # Create a simple test pattern with timestamp
-        frame_data = np.zeros((self.height, self.width, 3), dtype=np.uint8)
-
-        # Add color bars
-        bar_width = self.width // 8
-        colors = [
-            (255, 255, 255),  # White
-            (255, 255, 0),  # Yellow
-            (0, 255, 255),  # Cyan
-            (0, 255, 0),  # Green
-            (255, 0, 255),  # Magenta
-            (255, 0, 0),  # Red
-            (0, 0, 255),  # Blue
-            (0, 0, 0),  # Black
-        ]
-
-        for i, color in enumerate(colors):
-            x_start = i * bar_width
-            x_end = min((i + 1) * bar_width, self.width)
-            frame_data[:, x_start:x_end] = color
-
-        # Add frame counter text area (simplified - just a white box)
+    def _configure_camera(self, camera_format: str, controls: dict) -> None:
+        """Configure the camera's main stream and pick the matching frame converter."""
+        video_config = self.camera.create_video_configuration(
+            main={"size": (self.width, self.height), "format": camera_format},
+            controls=controls,
+        )
+
+        # Flip camera 180 degrees if needed (for upside-down mounting)
+        if self.flip_180:
+            video_config["transform"] = libcamera.Transform(hflip=1, vflip=1)
+
+        self.camera.configure(video_config)
+
+        if camera_format == CAMERA_FORMAT:
+            self._frame_format = FRAME_FORMAT
+            self._convert_frame = PiCameraVideoTrack._copy_yuv420
+        elif LIBYUV_AVAILABLE:
+            logger.info("Converting camera frames to yuv420p with libyuv")
+            self._frame_format = FRAME_FORMAT
+            self._convert_frame = PiCameraVideoTrack._convert_bgr24
+        else:
+            logger.warning("libyuv not installed - the encoder will convert BGR frames on the CPU")
+            self._frame_format = "bgr24"
+            self._convert_frame = PiCameraVideoTrack._copy_bgr24
+
+    def _start_capture_thread(self) -> None:
+        """Start the worker thread that pulls frames off the camera.
+
+        capture_request() blocks for the whole sensor readout, so running it
+        on the event loop would stall ICE, DTLS and signaling every frame.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._frames = asyncio.Queue(maxsize=1)
+        self._free_frames = queue.SimpleQueue()
+        self._frame_views = {}
+        for _ in range(FRAME_POOL_SIZE):
+            frame = VideoFrame(self.width, self.height, self._frame_format)
+            self._frame_views[id(frame)] = _plane_views(frame)
+            self._free_frames.put(frame)
+        self._in_flight = None
+        self._capture_stop.clear()
+        self._capture_thread = threading.Thread(
+            target=self._capture_loop, name="camera-capture", daemon=True
+        )
+        self._capture_thread.start()
+
+    def _capture_loop(self) -> None:
+        """Capture frames into the pool until stopped (runs on its own thread)."""
+        if self.capture_cpus:
+            # Keep the capture thread on its own cores so it doesn't migrate
+            # onto the one running the event loop. Affects this thread only.
+            try:
+                os.sched_setaffinity(0, self.capture_cpus)
+            except (AttributeError, OSError) as e:
+                logger.warning("Could not pin camera capture to CPUs {}: {}", self.capture_cpus, e)
+
+        while not self._capture_stop.is_set():
+            try:
+                frame = self._free_frames.get(timeout=0.5)
+            except queue.Empty:
+                continue
+
+            try:
+                # Map the completed request's buffer in place instead of
+                # capture_array(), which allocates a fresh copy every frame.
+                request = self.camera.capture_request()
+                try:
+                    with MappedArray(request, "main") as mapped:
+                        self._convert_frame(self, mapped.array, self._frame_views[id(frame)])
+                finally:
+                    request.release()
+            except Exception as e:
+                self._free_frames.put(frame)
+                if self._capture_stop.is_set():
+                    return
+                logger.error("Error capturing frame: {}", e)
+                metrics.camera_frame_errors_total.inc()
+                self._hand_off(e)
+                return
+
+            self._hand_off(frame)
+
+    def _hand_off(self, item: Union[VideoFrame, Exception]) -> None:
+        """Pass a captured frame (or capture error) from the thread to the loop."""
+        try:
+            self._loop.call_soon_threadsafe(self._publish, item)
+        except RuntimeError:
+            # Event loop already closed - we're shutting down
+            self._capture_stop.set()
+
+    def _publish(self, item: Union[VideoFrame, Exception]) -> None:
+        """Queue an item for recv(), replacing one it hasn't collected yet."""
+        if self._frames.full():
+            stale = self._frames.get_nowait()
+            if isinstance(stale, VideoFrame):
+                self._free_frames.put(stale)
+        self._frames.put_nowait(item)
+
+    def _build_mock_frame(self) -> VideoFrame:
+        """Build the static test pattern frame for mock mode."""
+        # Create a simple colour-bar test pattern directly in YUV 4:2:0. Each
+        # plane is one palette row broadcast down the frame and written straight
+        # into the frame's own (stride-padded) plane buffers, so there is no
+        # intermediate image and no layout for PyAV to copy or realign.
+        bar_width = max(self.width // 8, 1)
+        last_bar = len(_MOCK_PALETTE) - 1
+        luma_bars = np.minimum(np.arange(self.width) // bar_width, last_bar)
+        chroma_bars = np.minimum(np.arange(self.width // 2) * 2 // bar_width, last_bar)
+        luma_row = _MOCK_PALETTE[luma_bars]
+        chroma_row = _MOCK_PALETTE[chroma_bars]
+
+        video_frame = VideoFrame(self.width, self.height, FRAME_FORMAT)
+        y_plane, u_plane, v_plane = _plane_views(video_frame)
+        y_plane[:, : self.width] = luma_row[:, 0]
+        u_plane[:, : self.width // 2] = chroma_row[:, 1]
+        v_plane[:, : self.width // 2] = chroma_row[:, 2]
+
+        # Add frame counter text area (simplified - just a grey box)
         counter_height = 40
-        frame_data[:counter_height, :200] = (50, 50, 50)
+        y, u, v = _MOCK_COUNTER_YUV
+        y_plane[:counter_height, :200] = y
+        u_plane[: counter_height // 2, :100] = u
+        v_plane[: counter_height // 2, :100] = v
+
+        return video_frame
 
-        # Convert numpy array to av.VideoFrame
-        video_frame = VideoFrame.from_ndarray(frame_data, format="rgb24")
+    def _generate_mock_frame(self) -> VideoFrame:
+        """Return the test pattern frame stamped for the current frame count.
+
+        The pattern never changes for the life of the track, so it is built
+        once and only the timestamp is updated per call.
+        """
+        if self._mock_frame is None:
+            self._mock_frame = self._build_mock_frame()
+
+        video_frame = self._mock_frame
         video_frame.pts = self._frame_count
-        video_frame.time_base = av.Rational(1, self.framerate)
+        video_frame.time_base = self._time_base
 
         return video_frame
 
+    def _copy_yuv420(self, array: np.ndarray, views: tuple[np.ndarray, ...]) -> None:
+        """Split a picamera2 YUV420 buffer into the Y/U/V plane ``views`` of a frame.
+
+        picamera2 exposes the buffer as ``(height * 3 / 2, stride)``: the Y
+        plane, then the U and V planes back to back at half the stride.
+        """
+        height, width = self.height, self.width
+        stride = array.shape[1]
+        chroma = array[height:].reshape(-1)
+        chroma_size = (height // 2) * (stride // 2)
+        u_plane = chroma[:chroma_size].reshape(height // 2, stride // 2)
+        v_plane = chroma[chroma_size : 2 * chroma_size].reshape(height // 2, stride // 2)
+
+        _copy_into_plane(views[0], array[:height, :width])
+        _copy_into_plane(views[1], u_plane[:, : width // 2])
+        _copy_into_plane(views[2], v_plane[:, : width // 2])
+
+    def _convert_bgr24(self, array: np.ndarray, views: tuple[np.ndarray, ...]) -> None:
+        """Convert a picamera2 RGB888 (BGR byte order) buffer to yuv420p with libyuv."""
+        bgr24_to_i420(array, views[0], views[1], views[2], self.width, self.height)
+
+    def _copy_bgr24(self, array: np.ndarray, views: tuple[np.ndarray, ...]) -> None:
+        """Copy a picamera2 RGB888 (BGR byte order) buffer into a bgr24 frame."""
+        _copy_into_plane(views[0], array.reshape(self.height, -1))
+
     async def recv(self) -> VideoFrame:
         """
         Receive the next video frame.
 
         This method is called by aiortc to get frames for the video stream.
+        The first call starts the camera.
         """
-        if not self._is_running:
+        if not self._initialized:
+            self._initialized = True
             self._init_camera()
 
         pts, time_base = await self.next_timestamp()
@@ -192,40 +453,43 @@ class PiCameraVideoTrack(VideoStreamTrack):
             self._frame_count += 1
             metrics.camera_frames_total.inc()
 
-            # Simulate framerate delay
-            await asyncio.sleep(1.0 / self.framerate)
-
         else:
-            # Capture real frame from camera
-            try:
-                # Capture frame from picamera2
-                array = self.camera.capture_array()
+            # Take the latest frame from the capture thread
+            item = await self._frames.get()
+            if isinstance(item, Exception):
+                raise MediaStreamError(f"Camera capture failed: {item}")
 
-                # Use BGR format directly - picamera2 RGB888 seems to output BGR order
-                frame = VideoFrame.from_ndarray(array, format="bgr24")
-                frame.pts = pts
-                frame.time_base = time_base
+            # aiortc has finished encoding the previous frame by the time it
+            # asks for the next one, so it can go back into the pool.
+            if self._in_flight is not None:
+                self._free_frames.put(self._in_flight)
+            self._in_flight = item
 
-                self._frame_count += 1
-                metrics.camera_frames_total.inc()
+            frame = item
+            frame.pts = pts
+            frame.time_base = time_base
 
-            except Exception as e:
-                logger.error(f"Error capturing frame: {e}")
-                metrics.camera_frame_errors_total.inc()
-                raise MediaStreamError(f"Camera capture failed: {e}")
+            self._frame_count += 1
+            metrics.camera_frames_total.inc()
 
         # Update FPS metric and log framerate periodically
-        # Update FPS every 30 frames for more responsive metrics
-        if self._frame_count % 30 == 0:
-            elapsed = time.time() - self._start_time
-            actual_fps = self._frame_count / elapsed
-            metrics.camera_fps.set(actual_fps)
-
-        # Log framerate less frequently (every 10 seconds worth of frames)
+        # Update FPS every FPS_WINDOW_FRAMES frames for more responsive metrics
+        self._fps_window_frames += 1
+        if self._fps_window_frames >= FPS_WINDOW_FRAMES:
+            now = time.monotonic()
+            self._actual_fps = self._fps_window_frames / (now - self._fps_window_start)
+            metrics.camera_fps.set(self._actual_fps)
+            self._fps_window_start = now
+            self._fps_window_frames = 0
+
+        # Log framerate less frequently (every 10 seconds worth of frames).
+        # loguru only formats the message if DEBUG is actually enabled.
         if self._frame_count % (self.framerate * 10) == 0:
-            elapsed = time.time() - self._start_time
-            actual_fps = self._frame_count / elapsed
-            logger.debug(f"Camera stats - Frames: {self._frame_count}, FPS: {actual_fps:.1f}")
+            logger.opt(lazy=True).debug(
+                "Camera stats - Frames: {}, FPS: {:.1f}",
+                lambda: self._frame_count,
+                lambda: self._actual_fps,
+            )
 
         return frame
 
@@ -243,51 +507,38 @@ class PiCameraVideoTrack(VideoStreamTrack):
             color_gains: Manual color gains (red, blue)
             framerate: Target framerate (FPS)
         """
+        # Drop values that match the current state so a no-op skips the camera IPC
+        if awb_mode == self.awb_mode:
+            awb_mode = None
+        if color_gains is not None and tuple(color_gains) == tuple(self.color_gains):
+            color_gains = None
+        if framerate == self.framerate:
+            framerate = None
+        if awb_mode is None and color_gains is None and framerate is None:
+            logger.debug("Camera settings unchanged - nothing to apply")
+            return
+
         # Always update internal state (will be used when camera initializes)
         if awb_mode is not None:
             self.awb_mode = awb_mode
-            logger.info(f"Set AWB mode to: {self.awb_mode}")
+            logger.info("Set AWB mode to: {}", self.awb_mode)
         if color_gains is not None:
             self.color_gains = color_gains
-            logger.info(f"Set color gains to: {self.color_gains}")
+            logger.info("Set color gains to: {}", self.color_gains)
         if framerate is not None:
             self.framerate = framerate
-            logger.info(f"Set framerate to: {framerate}")
+            self._time_base = fractions.Fraction(1, framerate)
+            logger.info("Set framerate to: {}", framerate)
 
         # If camera is running, apply settings immediately
         if self.camera and not self.use_mock:
             try:
-                # Apply settings to camera
-                controls = {}
-
-                if self.awb_mode and self.awb_mode.lower() != "manual":
-                    # AWB modes are set by index
-                    awb_mode_index = {
-                        "auto": 0,
-                        "incandescent": 1,
-                        "tungsten": 2,
-                        "fluorescent": 3,
-                        "indoor": 4,
-                        "daylight": 5,
-                        "cloudy": 6,
-                        "greyworld": 0,  # Use auto mode as fallback
-                    }
-                    if self.awb_mode.lower() in awb_mode_index:
-                        controls["AwbEnable"] = True
-                        controls["AwbMode"] = awb_mode_index[self.awb_mode.lower()]
-                else:
-                    controls["AwbEnable"] = False
-                    controls["ColourGains"] = self.color_gains
-
-                if framerate is not None:
-                    controls["FrameRate"] = framerate
-
                 # Apply controls to running camera
-                self.camera.set_controls(controls)
+                self.camera.set_controls(self._build_controls(framerate=framerate))
                 logger.info("Applied settings to running camera")
 
             except Exception as e:
-                logger.error(f"Failed to apply camera settings: {e}")
+                logger.error("Failed to apply camera settings: {}", e)
         else:
             logger.info("Settings saved - will be applied when camera starts")
 
@@ -296,13 +547,19 @@ class PiCameraVideoTrack(VideoStreamTrack):
         super().stop()
         self._is_running = False
 
+        # Let the capture thread finish its current frame before closing the camera
+        if self._capture_thread is not None:
+            self._capture_stop.set()
+            self._capture_thread.join(timeout=1.0)
+            self._capture_thread = None
+
         if self.camera:
             try:
                 self.camera.stop()
                 self.camera.close()
                 logger.info("Pi camera stopped and cleaned up")
             except Exception as e:
-                logger.error(f"Error stopping camera: {e}")
+                logger.error("Error stopping camera: {}", e)
             finally:
                 self.camera = None
 
@@ -324,6 +581,7 @@ class CameraManager:
         is_noir: bool = True,
         awb_mode: str = "manual",
         color_gains: tuple[float, float] = (2.0, 1.2),
+        capture_cpus: Optional[set[int]] = None,
     ) -> None:
         """
         Initialize camera manager.
@@ -337,6 +595,7 @@ class CameraManager:
             is_noir: Whether using NoIR camera (requires color correction)
             awb_mode: Auto white balance mode (use 'manual' for color gains)
             color_gains: Manual color gains (red, blue) - only active when awb_mode='manual'
+            capture_cpus: CPU cores to pin the camera capture thread to (Linux only)
         """
         self.width = width
         self.height = height
@@ -346,7 +605,54 @@ class CameraManager:
         self.is_noir = is_noir
         self.awb_mode = awb_mode
         self.color_gains = color_gains
-        self.current_track: Optional[PiCameraVideoTrack] = None
+        self.capture_cpus = capture_cpus
+        # Settings as reported by the API. Kept in step by update_settings so the
+        # settings endpoints don't rebuild the dict on every request.
+        self._settings_snapshot = {
+            "enabled": enabled,
+            "width": width,
+            "height": height,
+            "framerate": framerate,
+            "flip_180": flip_180,
+            "is_noir": is_noir,
+            "awb_mode": awb_mode,
+            "color_gains": color_gains,
+        }
+        self._resolution_info = self._build_resolution_info()
+        # Only a weak reference is kept: the peer connection owns the track, so
+        # once it is dropped the manager doesn't pin it (and its frame pool).
+        self._track_ref: Optional[weakref.ref[PiCameraVideoTrack]] = None
+        # Serializes track swaps so racing offers (e.g. a reconnecting client)
+        # can't open the camera twice. A threading lock, since callers may be
+        # on the event loop or a worker thread.
+        self._track_lock = threading.Lock()
+
+        # Track updates arriving within SETTINGS_DEBOUNCE_S of each other (e.g.
+        # a dragged slider) are merged and applied with one set_controls call.
+        self._pending_track_update: dict = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._flush_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def settings_snapshot(self) -> dict:
+        """Return the current camera settings. The dict is shared - don't mutate it."""
+        return self._settings_snapshot
+
+    def resolution_info(self) -> dict[str, str]:
+        """Return the labels for the camera_resolution metric. Shared - don't mutate it."""
+        return self._resolution_info
+
+    def _build_resolution_info(self) -> dict[str, str]:
+        return {
+            "width": str(self.width),
+            "height": str(self.height),
+            "framerate": str(self.framerate),
+        }
+
+    @property
+    def current_track(self) -> Optional[PiCameraVideoTrack]:
+        """The most recently created video track, if it is still alive."""
+        track_ref = self._track_ref
+        return track_ref() if track_ref is not None else None
 
     def create_video_track(self) -> Optional[PiCameraVideoTrack]:
         """
@@ -359,25 +665,32 @@ class CameraManager:
             logger.info("Camera is disabled - no video track will be created")
             return None
 
-        # Stop existing track if any
-        if self.current_track:
-            logger.info("Stopping existing video track")
-            self.current_track.stop()
-
-        # Create new track
-        logger.info("Creating new camera video track")
-        self.current_track = PiCameraVideoTrack(
-            width=self.width,
-            height=self.height,
-            framerate=self.framerate,
-            flip_180=self.flip_180,
-            use_mock=not PICAMERA2_AVAILABLE,
-            is_noir=self.is_noir,
-            awb_mode=self.awb_mode,
-            color_gains=self.color_gains,
-        )
+        with self._track_lock:
+            # Stop existing track if any. The new track is built from the manager's
+            # state, so any queued settings update is already reflected in it.
+            self._cancel_track_update()
+            old_track = self.current_track
+            self._track_ref = None
+            if old_track:
+                logger.info("Stopping existing video track")
+                old_track.stop()
+
+            # Create new track
+            logger.info("Creating new camera video track")
+            track = PiCameraVideoTrack(
+                width=self.width,
+                height=self.height,
+                framerate=self.framerate,
+                flip_180=self.flip_180,
+                use_mock=not PICAMERA2_AVAILABLE,
+                is_noir=self.is_noir,
+                awb_mode=self.awb_mode,
+                color_gains=self.color_gains,
+                capture_cpus=self.capture_cpus,
+            )
+            self._track_ref = weakref.ref(track)
 
-        return self.current_track
+        return track
 
     def update_settings(
         self,
@@ -402,13 +715,14 @@ class CameraManager:
         """
         needs_restart = False
 
-        # Update manager state
-        if awb_mode is not None:
-            self.awb_mode = awb_mode
-        if color_gains is not None:
-            self.color_gains = color_gains
-        if framerate is not None:
-            self.framerate = framerate
+        # Keep only values that differ from the current state
+        changes: dict = {}
+        if awb_mode is not None and awb_mode != self.awb_mode:
+            changes["awb_mode"] = awb_mode
+        if color_gains is not None and tuple(color_gains) != tuple(self.color_gains):
+            changes["color_gains"] = tuple(color_gains)
+        if framerate is not None and framerate != self.framerate:
+            changes["framerate"] = framerate
 
         # Resolution changes require full restart
         if width is not None and width != self.width:
@@ -418,20 +732,94 @@ class CameraManager:
             self.height = height
             needs_restart = True
 
+        if not changes and not needs_restart:
+            return {"success": True, "needs_restart": False, "noop": True}
+
+        # Update manager state
+        for name, value in changes.items():
+            setattr(self, name, value)
+        self._settings_snapshot.update(changes)
+        if needs_restart:
+            self._settings_snapshot["width"] = self.width
+            self._settings_snapshot["height"] = self.height
+        if needs_restart or "framerate" in changes:
+            self._resolution_info = self._build_resolution_info()
+
         # Update running track if exists
         if self.current_track and not needs_restart:
-            self.current_track.update_settings(
-                awb_mode=awb_mode,
-                color_gains=color_gains,
-                framerate=framerate,
-            )
+            self._queue_track_update(changes)
             return {"success": True, "needs_restart": False}
 
         return {"success": True, "needs_restart": needs_restart}
 
+    def _queue_track_update(self, changes: dict) -> None:
+        """Merge ``changes`` into the pending track update and schedule a flush."""
+        self._pending_track_update.update(changes)
+        if self._flush_handle is not None:
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (sync caller) - nothing to batch with, apply now
+            with self._track_lock:
+                self._apply_track_update()
+            return
+        self._flush_loop = loop
+        self._flush_handle = loop.call_later(SETTINGS_DEBOUNCE_S, self._flush_track_update)
+
+    def _flush_track_update(self) -> None:
+        """Debounce timer callback: apply the pending settings on the event loop."""
+        # Don't block the loop behind a track swap or cleanup on a worker thread;
+        # retry once it has had time to finish. Updates queued during the swap
+        # then reach the new track. (If the swap cancelled this flush, there is
+        # no handle left to re-arm.)
+        if not self._track_lock.acquire(blocking=False):
+            if self._flush_handle is not None:
+                self._flush_handle = self._flush_loop.call_later(
+                    SETTINGS_DEBOUNCE_S, self._flush_track_update
+                )
+            return
+        try:
+            if self._flush_handle is None:  # cancelled while the timer was due
+                return
+            self._flush_handle = None
+            self._apply_track_update()
+        finally:
+            self._track_lock.release()
+
+    def _apply_track_update(self) -> None:
+        """Apply the merged pending settings to the current track. Needs _track_lock."""
+        pending, self._pending_track_update = self._pending_track_update, {}
+        track = self.current_track
+        if track and pending:
+            track.update_settings(**pending)
+
+    def _cancel_track_update(self) -> None:
+        """Drop any pending track update without applying it. Needs _track_lock.
+
+        May run on a worker thread (create_video_track and cleanup are offloaded),
+        so the timer itself is cancelled on the loop that scheduled it.
+        """
+        handle, self._flush_handle = self._flush_handle, None
+        self._pending_track_update = {}
+        if handle is None:
+            return
+        try:
+            on_loop = asyncio.get_running_loop() is self._flush_loop
+        except RuntimeError:
+            on_loop = False
+        if on_loop:
+            handle.cancel()
+        else:
+            self._flush_loop.call_soon_threadsafe(handle.cancel)
+
     def cleanup(self) -> None:
         """Clean up camera resources."""
-        if self.current_track:
-            logger.info("Cleaning up camera manager")
-            self.current_track.stop()
-            self.current_track = None
+        with self._track_lock:
+            self._cancel_track_update()
+            track = self.current_track
+            self._track_ref = None
+            if track:
+                logger.info("Cleaning up camera manager")
+                track.stop()
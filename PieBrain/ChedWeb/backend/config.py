@@ -1,5 +1,8 @@
 """Application configuration management."""
 
+from functools import cached_property
+from typing import Any
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -13,12 +16,28 @@ class Settings(BaseSettings):
     port: int = 8000
     debug: bool = False
     log_level: str = "INFO"
+    # uvicorn worker processes. Each worker opens its own camera, serial port
+    # and peer connection, so keep this at 1 on the rover; >1 disables reload.
+    workers: int = 1
+    # Origins allowed to call the API cross-origin. None keeps the default ("*"
+    # in debug, the Vite dev server otherwise); an empty list drops the CORS
+    # middleware entirely for same-origin or reverse-proxied deployments.
+    cors_origins: list[str] | None = None
+    # Threads for the app's own blocking work (metrics rendering, camera
+    # start/stop, process stats). A separate pool from the loop's default
+    # executor, so a slow offload can't hold up aiortc's video encoding there.
+    thread_pool_workers: int = 2
 
     # WebRTC
     stun_server: str = "stun:stun.l.google.com:19302"
     turn_server: str | None = None
     turn_username: str | None = None
     turn_password: str | None = None
+    # Reuse the live connection's answer when a client re-POSTs an identical
+    # offer within the TTL (seconds). Off by default: a reconnecting client that
+    # expects fresh ICE credentials would otherwise get the old ones.
+    cache_signaling_answers: bool = False
+    signaling_answer_cache_ttl: float = 5.0
 
     # Serial/UART (for ESP32 MotionDriver communication)
     # Use /dev/serial0 for GPIO UART on Raspberry Pi (GPIO 14/15)
@@ -38,6 +57,13 @@ class Settings(BaseSettings):
     camera_height: int = 480
     camera_framerate: int = 60
     camera_flip_180: bool = False  # Flip camera 180 degrees (hflip + vflip)
+    camera_is_noir: bool = True  # NoIR camera (no IR filter) - needs colour correction
+    camera_awb_mode: str = "auto"  # Auto white balance mode, or "manual" for colour gains
+    # Manual (red, blue) gains; higher red reduces the purple tint on NoIR
+    camera_color_gains: tuple[float, float] = (2.0, 1.2)
+    # Cores to pin the camera capture thread to, e.g. [1, 2, 3] on a Pi 3B to
+    # keep it off core 0 with the event loop. None leaves scheduling to the OS.
+    camera_capture_cpus: set[int] | None = None
 
     # Safety
     # The authoritative deadman lives in the ESP32 firmware; this mirrors that
@@ -45,9 +71,23 @@ class Settings(BaseSettings):
     deadman_timeout_ms: int = 1000
     command_rate_limit_hz: int = 50
 
-    @property
+    def camera_kwargs(self) -> dict[str, Any]:
+        """Keyword arguments for constructing the CameraManager."""
+        return {
+            "width": self.camera_width,
+            "height": self.camera_height,
+            "framerate": self.camera_framerate,
+            "flip_180": self.camera_flip_180,
+            "enabled": self.camera_enabled,
+            "is_noir": self.camera_is_noir,
+            "awb_mode": self.camera_awb_mode,
+            "color_gains": self.camera_color_gains,
+            "capture_cpus": self.camera_capture_cpus,
+        }
+
+    @cached_property
     def ice_servers(self) -> list[dict[str, str | list[str]]]:
-        """Build ICE server configuration for WebRTC."""
+        """ICE server configuration for WebRTC (built once; settings don't change at runtime)."""
         servers = [{"urls": [self.stun_server]}]
         if self.turn_server and self.turn_username and self.turn_password:
             servers.append(
@@ -1,17 +1,23 @@
 """FastAPI application for rover control backend."""
 
+import functools
 import sys
-import traceback
 import time
-from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, suppress
+from datetime import datetime, timezone
+from typing import Annotated, AsyncGenerator
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Request
+from fastapi import Depends, FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Request
+from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.requests import HTTPConnection
 from loguru import logger
-from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
+import orjson
+from prometheus_client import CONTENT_TYPE_LATEST
 import asyncio
 
 from config import settings
@@ -40,48 +46,68 @@ logger.add(
     level=settings.log_level,
 )
 
-# Global manager instances
-peer_manager: PeerManager | None = None
-camera_manager: CameraManager | None = None
-motion_driver: MotionDriverBridge | MockMotionDriverBridge | None = None
-power_monitor: PowerMonitor | None = None
-
+# /healthz and /api/config only depend on settings loaded at import, so their
+# bodies are encoded once here. Health only needs a fresh timestamp per call.
+_HEALTH_FIELDS = HealthResponse().model_dump(exclude={"timestamp"})
+_CONFIG_BODY = orjson.dumps(
+    {
+        "version": "0.1.0",
+        "stun_server": settings.stun_server,
+        "command_rate_limit_hz": settings.command_rate_limit_hz,
+        "deadman_timeout_ms": settings.deadman_timeout_ms,
+    }
+)
 
-async def update_metrics_periodically():
+async def update_metrics_periodically(executor: ThreadPoolExecutor):
     """Background task to update system metrics periodically."""
+    loop = asyncio.get_running_loop()
     while True:
         try:
-            metrics.update_process_metrics()
+            # Reads several /proc files, so keep it off the event loop
+            await loop.run_in_executor(executor, metrics.update_process_metrics)
             await asyncio.sleep(15)  # Update every 15 seconds
         except Exception as e:
-            logger.error(f"Error updating metrics: {e}")
+            logger.error("Error updating metrics: {}", e)
             await asyncio.sleep(15)
 
 
+async def _connect_motion_driver(
+    motion_driver: MotionDriverBridge | MockMotionDriverBridge,
+) -> None:
+    """Initial MotionDriver connect, run as a background task from lifespan."""
+    try:
+        await motion_driver.connect()
+    except Exception as e:
+        # The bridge supervisor keeps retrying in the background, so keep the
+        # instance around rather than dropping to None.
+        logger.error("MotionDriver initial connect error: {}", e)
+        logger.warning("MotionDriver will keep retrying to connect in the background")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan handler for startup/shutdown."""
-    global peer_manager, camera_manager, motion_driver, power_monitor
     logger.info("Starting ChedWeb backend...")
+    # uvloop is requested explicitly (see __main__ and the service files); log
+    # the loop actually running so a fallback to the stdlib loop is visible.
+    loop = asyncio.get_running_loop()
+    loop_cls = type(loop)
+    logger.info("Event loop: {}.{}", loop_cls.__module__, loop_cls.__name__)
+    # The app's own blocking work runs here rather than on the loop's default
+    # executor, which aiortc's video encoder uses.
+    executor = ThreadPoolExecutor(
+        max_workers=settings.thread_pool_workers, thread_name_prefix="chedweb"
+    )
     # Mirror application logs into the Debug tab's live log stream.
     debug_hub.install_log_capture(level=settings.log_level)
-    logger.info(f"Debug mode: {settings.debug}")
-    logger.info(f"ICE servers: {settings.ice_servers}")
-    logger.info(f"Camera enabled: {settings.camera_enabled}")
-    logger.info(f"Serial port: {settings.serial_port}")
-    logger.info(f"Serial mock mode: {settings.serial_mock}")
+    logger.info("Debug mode: {}", settings.debug)
+    logger.info("ICE servers: {}", settings.ice_servers)
+    logger.info("Camera enabled: {}", settings.camera_enabled)
+    logger.info("Serial port: {}", settings.serial_port)
+    logger.info("Serial mock mode: {}", settings.serial_mock)
 
     # Initialize camera manager
-    camera_manager = CameraManager(
-        width=settings.camera_width,
-        height=settings.camera_height,
-        framerate=settings.camera_framerate,
-        flip_180=settings.camera_flip_180,
-        enabled=settings.camera_enabled,
-        is_noir=True,  # Set to True for NoIR cameras
-        awb_mode="auto",  # Auto white balance by default
-        color_gains=(2.0, 1.2),  # Higher red gain to reduce purple tint on NoIR
-    )
+    camera_manager = CameraManager(**settings.camera_kwargs())
 
     # Initialize MotionDriver serial bridge
     if settings.serial_mock:
@@ -91,7 +117,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             baudrate=settings.serial_baudrate,
         )
     else:
-        logger.info(f"Initializing MotionDriver on {settings.serial_port}")
+        logger.info("Initializing MotionDriver on {}", settings.serial_port)
         motion_driver = MotionDriverBridge(
             port=settings.serial_port,
             baudrate=settings.serial_baudrate,
@@ -99,41 +125,45 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             reconnect_interval=settings.serial_reconnect_interval,
         )
 
-    try:
-        await motion_driver.connect()
-    except Exception as e:
-        # The bridge supervisor keeps retrying in the background, so keep the
-        # instance around rather than dropping to None.
-        logger.error(f"MotionDriver initial connect error: {e}")
-        logger.warning("MotionDriver will keep retrying to connect in the background")
+    # The PING/PONG handshake can take seconds (longer with no ESP32 attached),
+    # so connect in the background and start serving /healthz and /metrics now.
+    # Until the link is up the bridge drops commands with a warning.
+    motion_connect_task = asyncio.create_task(_connect_motion_driver(motion_driver))
 
     # Initialize peer manager with motion driver
     peer_manager = PeerManager(
         ice_servers=settings.ice_servers,
         motion_driver=motion_driver,
+        executor=executor,
     )
 
     # Initialize metrics
     metrics.camera_enabled.set(1 if settings.camera_enabled else 0)
-    metrics.motion_driver_connected.set(
-        1 if (motion_driver and motion_driver.is_connected()) else 0
-    )
+    # Read at scrape time, so they follow reconnects and peers dropping on their own
+    metrics.motion_driver_connected.set_function(motion_driver.is_connected)
+    metrics.webrtc_connections_active.set_function(peer_manager.active_connections)
     if camera_manager:
-        metrics.camera_resolution.info(
-            {
-                "width": str(camera_manager.width),
-                "height": str(camera_manager.height),
-                "framerate": str(camera_manager.framerate),
-            }
-        )
+        metrics.set_camera_resolution(camera_manager.resolution_info())
 
     # Start background metrics update task
-    metrics_task = asyncio.create_task(update_metrics_periodically())
+    metrics_task = asyncio.create_task(update_metrics_periodically(executor))
 
     # Start Pi power/brownout monitor (no-op off real Pi hardware)
     power_monitor = PowerMonitor()
     await power_monitor.start()
 
+    # Serializes renegotiation so overlapping offers can't each close and rebuild
+    # the peer connection (leaking a PC and a camera track).
+    offer_lock = asyncio.Lock()
+
+    # Handlers receive these through the get_* dependencies below
+    app.state.camera_manager = camera_manager
+    app.state.motion_driver = motion_driver
+    app.state.peer_manager = peer_manager
+    app.state.power_monitor = power_monitor
+    app.state.executor = executor
+    app.state.offer_lock = offer_lock
+
     yield
 
     # Cleanup
@@ -144,15 +174,30 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except asyncio.CancelledError:
         pass
 
+    # These are independent, and closing the peer connection can take seconds
+    # of ICE/DTLS teardown, so run them concurrently. One failing mustn't stop
+    # the others from releasing their resources.
+    teardown = []
     if power_monitor:
-        await power_monitor.stop()
+        teardown.append(power_monitor.stop())
     if peer_manager:
-        await peer_manager.close()
+        teardown.append(peer_manager.close())
     if camera_manager:
-        camera_manager.cleanup()
+        teardown.append(loop.run_in_executor(executor, camera_manager.cleanup))
+    for result in await asyncio.gather(*teardown, return_exceptions=True):
+        if isinstance(result, Exception):
+            logger.error("Error during shutdown: {}", result)
+
+    # Last, so motor stops sent while the peer connection closes still go out
+    if not motion_connect_task.done():
+        motion_connect_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await motion_connect_task
     if motion_driver:
         await motion_driver.disconnect()
 
+    executor.shutdown(wait=False)
+
 
 # Create FastAPI application
 app = FastAPI(
@@ -162,32 +207,105 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
-# CORS middleware - allow all origins in development
-# TODO: Restrict origins in production
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"] if settings.debug else ["http://localhost:5173"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Manager instances live on app.state. They're created in lifespan; until then
+# (or when the app runs without lifespan) they're None.
+app.state.camera_manager = None
+app.state.motion_driver = None
+app.state.peer_manager = None
+app.state.power_monitor = None
+app.state.executor = None
+app.state.offer_lock = None
+
+
+def get_camera_manager(conn: HTTPConnection) -> CameraManager | None:
+    return conn.app.state.camera_manager
+
+
+def get_motion_driver(conn: HTTPConnection) -> MotionDriverBridge | MockMotionDriverBridge | None:
+    return conn.app.state.motion_driver
+
+
+def get_peer_manager(conn: HTTPConnection) -> PeerManager | None:
+    return conn.app.state.peer_manager
+
+
+def get_power_monitor(conn: HTTPConnection) -> PowerMonitor | None:
+    return conn.app.state.power_monitor
+
+
+def get_executor(conn: HTTPConnection) -> ThreadPoolExecutor | None:
+    return conn.app.state.executor
+
+
+def get_offer_lock(conn: HTTPConnection) -> asyncio.Lock | None:
+    return conn.app.state.offer_lock
+
+
+CameraManagerDep = Annotated[CameraManager | None, Depends(get_camera_manager)]
+MotionDriverDep = Annotated[
+    MotionDriverBridge | MockMotionDriverBridge | None, Depends(get_motion_driver)
+]
+PeerManagerDep = Annotated[PeerManager | None, Depends(get_peer_manager)]
+PowerMonitorDep = Annotated[PowerMonitor | None, Depends(get_power_monitor)]
+ExecutorDep = Annotated[ThreadPoolExecutor | None, Depends(get_executor)]
+OfferLockDep = Annotated[asyncio.Lock | None, Depends(get_offer_lock)]
+
+# Compress larger responses (mostly the SDP answer). Level 1 keeps the CPU cost
+# negligible on the Pi. Added before CORS so CORS stays the outer layer and
+# preflight responses pass straight through. WebSockets are never compressed.
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=1)
+
+# CORS middleware - allow all origins in development. Skipped entirely when
+# CORS_ORIGINS is set to an empty list (headers served by a reverse proxy, or
+# the UI is same-origin), which saves a middleware layer on every request.
+cors_origins = settings.cors_origins
+if cors_origins is None:
+    cors_origins = ["*"] if settings.debug else ["http://localhost:5173"]
+if cors_origins:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=cors_origins,
+        allow_credentials=True,
+        # The API only uses GET and POST with a JSON body. Browsers cache the
+        # preflight for max_age (Chromium caps it at 2 hours), so repeat
+        # signaling and settings POSTs skip the extra OPTIONS round-trip.
+        allow_methods=["GET", "POST"],
+        allow_headers=["Content-Type"],
+        max_age=86400,
+    )
+
+
+# Metrics middleware to track HTTP requests. The scrape endpoint itself is
+# skipped so scrapes don't meter themselves.
+_METRICS_SKIP_PATHS = frozenset({"/metrics"})
+
+
+@functools.cache
+def _route_paths() -> frozenset[str]:
+    """Paths of all registered routes (none take path parameters)."""
+    return frozenset(route.path for route in app.routes)
 
 
-# Metrics middleware to track HTTP requests
 @app.middleware("http")
 async def metrics_middleware(request: Request, call_next):
     """Track HTTP request metrics."""
-    method = request.method
-    endpoint = request.url.path
+    # Read straight from the ASGI scope; request.url builds a URL object
+    scope = request.scope
+    method = scope["method"]
+    endpoint = scope["path"]
 
-    # Skip metrics endpoint itself to avoid recursion
-    if endpoint == "/metrics":
+    if endpoint in _METRICS_SKIP_PATHS:
         return await call_next(request)
+    # Unknown paths (scanners, typos) share one label so they can't grow the
+    # number of metric children without bound.
+    if endpoint not in _route_paths():
+        endpoint = "unmatched"
 
     # Track in-progress requests
-    metrics.http_requests_in_progress.labels(method=method, endpoint=endpoint).inc()
+    in_progress = metrics.http_in_progress_child(method, endpoint)
+    in_progress.inc()
 
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     status_code = 500
 
     try:
@@ -195,44 +313,38 @@ async def metrics_middleware(request: Request, call_next):
         status_code = response.status_code
         return response
     except Exception as e:
-        logger.error(f"Error in request {method} {endpoint}: {e}")
-        metrics.errors_total.labels(error_type="http_exception", component="api").inc()
+        logger.error("Error in request {} {}: {}", method, endpoint, e)
+        metrics.errors_http.inc()
         raise
     finally:
         # Track request completion
-        duration = time.time() - start_time
-        metrics.http_requests_total.labels(
-            method=method,
-            endpoint=endpoint,
-            status=status_code,
-        ).inc()
-        metrics.http_request_duration_seconds.labels(
-            method=method,
-            endpoint=endpoint,
-        ).observe(duration)
-        metrics.http_requests_in_progress.labels(method=method, endpoint=endpoint).dec()
-
-
-# Add validation exception handler for better debugging
+        duration = (time.perf_counter_ns() - start_ns) * 1e-9
+        metrics.http_requests_child(method, endpoint, status_code).inc()
+        metrics.http_duration_child(method, endpoint).observe(duration)
+        in_progress.dec()
+
+
+# Validation errors return 400. The request body (potentially a large SDP) is
+# never echoed back, and the error details are only rendered at DEBUG.
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
-    logger.error(f"Validation error on {request.url}")
-    logger.error(f"Errors: {exc.errors()}")
-    logger.error(f"Body: {exc.body}")
+    logger.warning("Validation error on {} {}", request.method, request.url.path)
+    logger.opt(lazy=True).debug("Validation errors: {}", exc.errors)
     return JSONResponse(
         status_code=400,
-        content={"detail": exc.errors(), "body": exc.body},
+        content={"detail": jsonable_encoder(exc.errors())},
     )
 
 
 @app.get("/healthz", response_model=HealthResponse, tags=["System"])
-async def health_check() -> HealthResponse:
+async def health_check() -> Response:
     """Health check endpoint."""
-    return HealthResponse()
+    body = orjson.dumps({**_HEALTH_FIELDS, "timestamp": datetime.now(timezone.utc)})
+    return Response(content=body, media_type="application/json")
 
 
 @app.get("/metrics", tags=["System"])
-async def get_metrics() -> Response:
+async def get_metrics(executor: ExecutorDep) -> Response:
     """
     Prometheus metrics endpoint.
 
@@ -240,21 +352,28 @@ async def get_metrics() -> Response:
     for scraping by Grafana Alloy or other Prometheus-compatible collectors.
     """
     return Response(
-        content=generate_latest(),
+        content=await metrics.render_latest(executor),
         media_type=CONTENT_TYPE_LATEST,
+        headers={"Cache-Control": "no-cache"},
     )
 
 
 @app.post("/signaling/offer", response_model=SDPAnswer, tags=["WebRTC"])
-async def handle_signaling_offer(offer: SDPOffer) -> SDPAnswer:
+async def handle_signaling_offer(
+    offer: SDPOffer,
+    peer_manager: PeerManagerDep,
+    camera_manager: CameraManagerDep,
+    executor: ExecutorDep,
+    offer_lock: OfferLockDep,
+) -> SDPAnswer:
     """
     Handle WebRTC signaling offer and return answer.
 
     This endpoint receives an SDP offer from the client, creates a peer connection,
     and returns an SDP answer to complete the WebRTC negotiation.
     """
-    logger.info(f"Received request at /signaling/offer")
-    logger.debug(f"Offer payload: {offer}")
+    logger.info("Received request at /signaling/offer")
+    logger.opt(lazy=True).debug("Offer payload: {}", lambda: offer)
 
     if not peer_manager:
         raise HTTPException(status_code=500, detail="Peer manager not initialized")
@@ -262,46 +381,64 @@ async def handle_signaling_offer(offer: SDPOffer) -> SDPAnswer:
     if not camera_manager:
         raise HTTPException(status_code=500, detail="Camera manager not initialized")
 
-    try:
-        logger.info("Received SDP offer from client")
-
-        # Close any existing peer connection before creating a new one
-        if peer_manager.pc:
-            logger.info("Closing existing peer connection")
-            await peer_manager.close()
-            metrics.webrtc_connections_active.dec()
-
-        # Create a new video track for this connection
-        video_track = camera_manager.create_video_track()
-        if video_track:
-            logger.info("Video track created successfully")
-        else:
-            logger.warning("No video track created - camera may be disabled")
+    if not offer_lock:
+        raise HTTPException(status_code=500, detail="Offer lock not initialized")
 
-        # Update peer manager with the video track before handling offer
-        peer_manager.video_track = video_track
+    async with offer_lock:
+        # A client retrying the same offer (e.g. after a timed-out POST) can get
+        # the answer already negotiated instead of a torn-down connection.
+        if settings.cache_signaling_answers:
+            cached_sdp = peer_manager.cached_answer(
+                offer.sdp, max_age=settings.signaling_answer_cache_ttl
+            )
+            if cached_sdp:
+                logger.info("Duplicate SDP offer - returning existing answer")
+                return SDPAnswer(sdp=cached_sdp, type="answer")
 
-        # Process the offer and create answer (this will create peer connection with video track)
-        answer_sdp = await peer_manager.handle_offer(offer.sdp)
-
-        # Track successful WebRTC connection
-        metrics.webrtc_connections_total.labels(status="success").inc()
-        metrics.webrtc_connections_active.inc()
-
-        logger.info("Returning SDP answer to client")
-        return SDPAnswer(sdp=answer_sdp, type="answer")
-    except Exception as e:
-        logger.error(f"Error handling signaling offer: {e}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        try:
+            logger.info("Received SDP offer from client")
+
+            # Close any existing peer connection before creating a new one
+            if peer_manager.pc:
+                logger.info("Closing existing peer connection")
+                await peer_manager.close()
+
+            # Create a new video track for this connection. Stopping the old
+            # track joins its capture thread and closes the camera, which blocks,
+            # so keep it off the event loop.
+            video_track = await asyncio.get_running_loop().run_in_executor(
+                executor, camera_manager.create_video_track
+            )
+            if video_track:
+                logger.info("Video track created successfully")
+            else:
+                logger.warning("No video track created - camera may be disabled")
+
+            # Update peer manager with the video track before handling offer
+            peer_manager.video_track = video_track
+
+            # Process the offer and create answer (this will create peer connection with
+            # video track)
+            answer_sdp = await peer_manager.handle_offer(offer.sdp)
+
+            # Track successful WebRTC connection
+            metrics.webrtc_conn_ok.inc()
+
+            logger.info("Returning SDP answer to client")
+            return SDPAnswer(sdp=answer_sdp, type="answer")
+        except Exception as e:
+            logger.opt(exception=True).error("Error handling signaling offer: {}", e)
 
-        # Track failed WebRTC connection
-        metrics.webrtc_connections_total.labels(status="failed").inc()
-        metrics.errors_total.labels(error_type="webrtc_offer", component="webrtc").inc()
+            # Track failed WebRTC connection
+            metrics.webrtc_conn_failed.inc()
+            metrics.errors_webrtc_offer.inc()
 
-        raise HTTPException(status_code=500, detail=str(e))
+            raise HTTPException(status_code=500, detail=str(e))
 
 
-def _heartbeat_snapshot() -> dict:
+def _heartbeat_snapshot(
+    motion_driver: MotionDriverBridge | MockMotionDriverBridge | None,
+) -> dict:
     """Heartbeat stats for the Debug tab, plus the deadman window for context."""
     if not motion_driver:
         return {"available": False, "deadman_ms": settings.deadman_timeout_ms}
@@ -311,7 +448,12 @@ def _heartbeat_snapshot() -> dict:
     return stats
 
 
-async def _handle_debug_command(data: dict, armed: dict, out: asyncio.Queue) -> None:
+async def _handle_debug_command(
+    motion_driver: MotionDriverBridge | MockMotionDriverBridge | None,
+    data: dict,
+    armed: dict,
+    out: asyncio.Queue,
+) -> None:
     """Apply a single inbound debug command. Motion is gated behind ``armed``."""
     if not motion_driver:
         out.put_nowait({"type": "error", "detail": "MotionDriver not initialised"})
@@ -385,8 +527,19 @@ async def _handle_debug_command(data: dict, armed: dict, out: asyncio.Queue) ->
     out.put_nowait({"type": "error", "detail": f"Unknown command type: {cmd_type}"})
 
 
+# Most debug hub events coalesced into a single "batch" WebSocket frame
+_DEBUG_WS_MAX_BATCH = 64
+
+
+async def _send_debug_json(websocket: WebSocket, payload: dict) -> None:
+    """Send ``payload`` as a JSON text frame (the Debug tab parses text, not blobs)."""
+    await websocket.send_text(orjson.dumps(payload).decode())
+
+
 @app.websocket("/ws/debug")
-async def websocket_debug(websocket: WebSocket) -> None:
+async def websocket_debug(
+    websocket: WebSocket, motion_driver: MotionDriverDep, power_monitor: PowerMonitorDep
+) -> None:
     """Live debug channel: streams serial TX/RX, heartbeat, power flags and
     logs to the browser, and accepts whitelisted actuator/console commands.
 
@@ -402,19 +555,20 @@ async def websocket_debug(websocket: WebSocket) -> None:
     log_q = debug_hub.log_broadcaster.subscribe()
 
     # Seed the client with recent history and current state.
-    await websocket.send_json(
+    await _send_debug_json(
+        websocket,
         {
             "type": "snapshot",
             "serial": motion_driver.events.recent() if motion_driver else [],
             "logs": debug_hub.log_broadcaster.recent(),
-            "heartbeat": _heartbeat_snapshot(),
+            "heartbeat": _heartbeat_snapshot(motion_driver),
             "power": power_monitor.snapshot() if power_monitor else {"available": False},
             "config": {
                 "deadman_ms": settings.deadman_timeout_ms,
                 "heartbeat_interval_ms": settings.serial_heartbeat_interval * 1000,
                 "serial_mock": settings.serial_mock,
             },
-        }
+        },
     )
 
     async def relay(queue: asyncio.Queue, kind: str) -> None:
@@ -429,7 +583,7 @@ async def websocket_debug(websocket: WebSocket) -> None:
         while True:
             await asyncio.sleep(0.5)
             try:
-                out.put_nowait({"type": "heartbeat", **_heartbeat_snapshot()})
+                out.put_nowait({"type": "heartbeat", **_heartbeat_snapshot(motion_driver)})
                 if power_monitor:
                     out.put_nowait({"type": "power", **power_monitor.snapshot()})
             except asyncio.QueueFull:
@@ -437,16 +591,23 @@ async def websocket_debug(websocket: WebSocket) -> None:
 
     async def sender() -> None:
         while True:
-            msg = await out.get()
-            await websocket.send_json(msg)
+            batch = [await out.get()]
+            # Send whatever else is already queued (a burst of serial lines or
+            # log records) in the same frame rather than one frame per event.
+            while len(batch) < _DEBUG_WS_MAX_BATCH and not out.empty():
+                batch.append(out.get_nowait())
+            if len(batch) == 1:
+                await _send_debug_json(websocket, batch[0])
+            else:
+                await _send_debug_json(websocket, {"type": "batch", "messages": batch})
 
     async def receiver() -> None:
         while True:
-            data = await websocket.receive_json()
+            data = orjson.loads(await websocket.receive_text())
             try:
-                await _handle_debug_command(data, armed, out)
+                await _handle_debug_command(motion_driver, data, armed, out)
             except Exception as exc:
-                logger.error(f"Debug command error: {exc}")
+                logger.opt(exception=True).error("Debug command error: {}", exc)
                 out.put_nowait({"type": "error", "detail": str(exc)})
 
     tasks = [asyncio.create_task(sender()), asyncio.create_task(periodic()), asyncio.create_task(receiver())]
@@ -476,40 +637,28 @@ async def websocket_debug(websocket: WebSocket) -> None:
 
 
 @app.get("/api/config", tags=["Configuration"])
-async def get_config() -> dict[str, str | int]:
+async def get_config() -> Response:
     """
     Get public configuration for client.
 
     Returns non-sensitive configuration values needed by the frontend.
     """
-    return {
-        "version": "0.1.0",
-        "stun_server": settings.stun_server,
-        "command_rate_limit_hz": settings.command_rate_limit_hz,
-        "deadman_timeout_ms": settings.deadman_timeout_ms,
-    }
+    return Response(content=_CONFIG_BODY, media_type="application/json")
 
 
 @app.get("/api/camera/settings", tags=["Camera"])
-async def get_camera_settings() -> dict:
+async def get_camera_settings(camera_manager: CameraManagerDep) -> dict:
     """Get current camera settings."""
     if not camera_manager:
         raise HTTPException(status_code=503, detail="Camera manager not initialized")
 
-    return {
-        "enabled": camera_manager.enabled,
-        "width": camera_manager.width,
-        "height": camera_manager.height,
-        "framerate": camera_manager.framerate,
-        "flip_180": camera_manager.flip_180,
-        "is_noir": camera_manager.is_noir,
-        "awb_mode": camera_manager.awb_mode,
-        "color_gains": camera_manager.color_gains,
-    }
+    return camera_manager.settings_snapshot()
 
 
 @app.post("/api/camera/settings", response_model=CameraSettingsResponse, tags=["Camera"])
-async def update_camera_settings(settings: CameraSettings) -> CameraSettingsResponse:
+async def update_camera_settings(
+    settings: CameraSettings, camera_manager: CameraManagerDep
+) -> CameraSettingsResponse:
     """
     Update camera settings on the fly.
 
@@ -537,26 +686,9 @@ async def update_camera_settings(settings: CameraSettings) -> CameraSettingsResp
         height=settings.height,
     )
 
-    current_settings = {
-        "enabled": camera_manager.enabled,
-        "width": camera_manager.width,
-        "height": camera_manager.height,
-        "framerate": camera_manager.framerate,
-        "flip_180": camera_manager.flip_180,
-        "is_noir": camera_manager.is_noir,
-        "awb_mode": camera_manager.awb_mode,
-        "color_gains": camera_manager.color_gains,
-    }
+    current_settings = camera_manager.settings_snapshot()
 
-    # Update camera resolution metric if changed
-    if settings.width is not None or settings.height is not None or settings.framerate is not None:
-        metrics.camera_resolution.info(
-            {
-                "width": str(camera_manager.width),
-                "height": str(camera_manager.height),
-                "framerate": str(camera_manager.framerate),
-            }
-        )
+    metrics.set_camera_resolution(camera_manager.resolution_info())
 
     return CameraSettingsResponse(
         success=result["success"],
@@ -577,7 +709,7 @@ def handle_control_command(command: ControlCommand) -> None:
 
     TODO: Implement actual command forwarding to UART/ESP32.
     """
-    logger.info(f"Handling control command: {command}")
+    logger.info("Handling control command: {}", command)
     # Stub: In production, forward to serial bridge
     # serial_bridge.send_command(command)
 
@@ -589,6 +721,11 @@ if __name__ == "__main__":
         "main:app",
         host=settings.host,
         port=settings.port,
-        reload=settings.debug,
+        # The reload watcher is a dev convenience and can't run with multiple workers
+        reload=settings.debug and settings.workers == 1,
+        workers=settings.workers,
+        loop="uvloop",
+        http="httptools",
+        ws="websockets",
         log_level=settings.log_level.lower(),
     )
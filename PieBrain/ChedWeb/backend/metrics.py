@@ -1,9 +1,28 @@
 """Prometheus metrics for ChedWeb backend monitoring."""
 
-from prometheus_client import Counter, Gauge, Histogram, Info
+import asyncio
+from concurrent.futures import Executor
+from functools import lru_cache
+
+from prometheus_client import (
+    Counter,
+    Gauge,
+    Histogram,
+    Info,
+    disable_created_metrics,
+    generate_latest,
+)
 import psutil
 import time
 
+# Don't export a *_created series alongside every counter/histogram child. The
+# dashboards don't use them and each one is an extra line per label set in
+# every scrape. Must run before any metric is created.
+disable_created_metrics()
+
+# Scrapes within this window share one serialized payload
+METRICS_CACHE_TTL_S = 1.0
+
 # ========================================
 # APPLICATION INFO
 # ========================================
@@ -30,7 +49,10 @@ http_request_duration_seconds = Histogram(
     "chedweb_http_request_duration_seconds",
     "HTTP request latency",
     ["method", "endpoint"],
-    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+    # Few buckets: every (method, endpoint) child carries one counter per bucket.
+    # Most requests take 1-500 ms; the 2.5 s and 10 s buckets keep the dashboard's
+    # p95/p99 meaningful for /signaling/offer, which waits for ICE gathering.
+    buckets=(0.001, 0.01, 0.05, 0.25, 1.0, 2.5, 10.0),
 )
 
 http_requests_in_progress = Gauge(
@@ -39,6 +61,24 @@ http_requests_in_progress = Gauge(
     ["method", "endpoint"],
 )
 
+
+# Labelled children for the HTTP middleware. .labels() does a locked dict lookup
+# on every call, so each label combination is resolved once and reused.
+@lru_cache(maxsize=256)
+def http_requests_child(method: str, endpoint: str, status: int) -> Counter:
+    return http_requests_total.labels(method=method, endpoint=endpoint, status=status)
+
+
+@lru_cache(maxsize=256)
+def http_duration_child(method: str, endpoint: str) -> Histogram:
+    return http_request_duration_seconds.labels(method=method, endpoint=endpoint)
+
+
+@lru_cache(maxsize=256)
+def http_in_progress_child(method: str, endpoint: str) -> Gauge:
+    return http_requests_in_progress.labels(method=method, endpoint=endpoint)
+
+
 # ========================================
 # WEBRTC METRICS
 # ========================================
@@ -48,6 +88,8 @@ webrtc_connections_total = Counter(
     "Total WebRTC connections attempted",
     ["status"],  # success, failed
 )
+webrtc_conn_ok = webrtc_connections_total.labels(status="success")
+webrtc_conn_failed = webrtc_connections_total.labels(status="failed")
 
 webrtc_connections_active = Gauge(
     "chedweb_webrtc_connections_active",
@@ -100,6 +142,17 @@ camera_resolution = Info(
     "Camera resolution settings",
 )
 
+# Single-slot holder for the last published labels
+_last_camera_resolution: list[dict[str, str] | None] = [None]
+
+
+def set_camera_resolution(info: dict[str, str]) -> None:
+    """Publish the camera_resolution labels, skipping the update if they haven't changed."""
+    if info == _last_camera_resolution[0]:
+        return
+    _last_camera_resolution[0] = info
+    camera_resolution.info(info)
+
 camera_settings_changes_total = Counter(
     "chedweb_camera_settings_changes_total",
     "Total camera settings changes",
@@ -147,6 +200,8 @@ process_memory_bytes = Gauge(
     "Memory usage in bytes of the backend process",
     ["type"],  # rss, vms
 )
+process_memory_rss = process_memory_bytes.labels(type="rss")
+process_memory_vms = process_memory_bytes.labels(type="vms")
 
 process_open_fds = Gauge(
     "chedweb_process_open_file_descriptors",
@@ -188,24 +243,59 @@ errors_total = Counter(
     "Total errors by type",
     ["error_type", "component"],
 )
+# Label sets used by fixed call sites, bound once instead of per error
+errors_http = errors_total.labels(error_type="http_exception", component="api")
+errors_webrtc_offer = errors_total.labels(error_type="webrtc_offer", component="webrtc")
+errors_metrics_update = errors_total.labels(error_type="metrics_update", component="system")
 
 # ========================================
 # HELPER FUNCTIONS
 # ========================================
 
+# Single slot holding (rendered_at, payload); swapped whole so readers never see a mix
+_metrics_cache: list[tuple[float, bytes]] = [(float("-inf"), b"")]
+_metrics_lock = asyncio.Lock()
+
+
+async def render_latest(executor: Executor | None = None) -> bytes:
+    """Return the registry in Prometheus text format, cached for METRICS_CACHE_TTL_S.
+
+    Serialization runs in ``executor`` (the loop's default if None) so a scrape
+    doesn't block the event loop, and concurrent scrapes on a miss wait for a
+    single render.
+    """
+    rendered_at, payload = _metrics_cache[0]
+    if time.monotonic() - rendered_at < METRICS_CACHE_TTL_S:
+        return payload
+
+    async with _metrics_lock:
+        rendered_at, payload = _metrics_cache[0]
+        if time.monotonic() - rendered_at < METRICS_CACHE_TTL_S:
+            return payload
+        payload = await asyncio.get_running_loop().run_in_executor(executor, generate_latest)
+        _metrics_cache[0] = (time.monotonic(), payload)
+        return payload
+
+
+# Reused so cpu_percent(interval=None) can measure usage since the previous
+# update instead of sleeping for a sample window. Primed here so the first
+# update reports a real value rather than 0.
+_process = psutil.Process()
+_process.cpu_percent(interval=None)
+
 
 def update_process_metrics():
     """Update process-specific system metrics."""
     try:
-        process = psutil.Process()
+        process = _process
 
-        # CPU usage
-        process_cpu_usage.set(process.cpu_percent(interval=0.1))
+        # CPU usage (averaged over the interval since the last update)
+        process_cpu_usage.set(process.cpu_percent(interval=None))
 
         # Memory usage
         mem_info = process.memory_info()
-        process_memory_bytes.labels(type="rss").set(mem_info.rss)
-        process_memory_bytes.labels(type="vms").set(mem_info.vms)
+        process_memory_rss.set(mem_info.rss)
+        process_memory_vms.set(mem_info.vms)
 
         # File descriptors (Unix-like systems)
         try:
@@ -218,4 +308,4 @@ def update_process_metrics():
         process_threads.set(process.num_threads())
 
     except Exception as e:
-        errors_total.labels(error_type="metrics_update", component="system").inc()
+        errors_metrics_update.inc()
@@ -1,6 +1,6 @@
 """Pydantic models for API requests and responses."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Literal
 
 from pydantic import BaseModel, Field
@@ -24,7 +24,9 @@ class HealthResponse(BaseModel):
     """Health check response."""
 
     status: str = Field(default="ok", description="Service status")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Current timestamp")
+    timestamp: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc), description="Current timestamp"
+    )
     version: str = Field(default="0.1.0", description="API version")
 
 
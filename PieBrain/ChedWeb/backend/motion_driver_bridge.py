@@ -1,6 +1,7 @@
 """Serial bridge for communicating with ESP32 MotionDriver via UART."""
 
 import asyncio
+import os
 import time
 from collections import deque
 from typing import Any, Optional
@@ -36,6 +37,57 @@ def servo_angle_to_pulse_us(angle_deg: float) -> int:
     return round(SERVO_MIN_PULSE_US + (angle / SERVO_MAX_ANGLE_DEG) * span)
 
 
+# Fixed parts of the per-wheel command lines, built once rather than on every
+# control tick. Only the speed / pulse width is formatted per command.
+_WHEEL_COUNT = 6
+_MOTOR_STOP_LINES = tuple(f"MOTOR {i} STOP\n" for i in range(_WHEEL_COUNT))
+_MOTOR_FORWARD_PREFIXES = tuple(f"MOTOR {i} FORWARD " for i in range(_WHEEL_COUNT))
+_MOTOR_BACKWARD_PREFIXES = tuple(f"MOTOR {i} BACKWARD " for i in range(_WHEEL_COUNT))
+_SERVO_PREFIXES = tuple(f"S {i} " for i in range(_WHEEL_COUNT))
+
+# send_command skips wheels whose command line is unchanged, but resends the
+# full state at least this often in case the ESP32 reset without the serial
+# link dropping (e.g. a brownout on the GPIO UART).
+COMMAND_REFRESH_INTERVAL_S = 0.5
+
+# Bytes queued for the UART above which senders wait for it to drain: about a
+# third of a second of traffic at 115200 baud.
+_TX_HIGH_WATER = 4096
+
+
+def _motor_line(motor_id: int, speed: float) -> str:
+    """Build the MOTOR command for a signed speed in -1.0..1.0.
+
+    The magnitude is sent with three decimals, finer than the firmware's PWM
+    resolution and far shorter on the wire than repr() of an arbitrary float.
+    """
+    if speed == 0:
+        return _MOTOR_STOP_LINES[motor_id]
+    if speed > 0:
+        return f"{_MOTOR_FORWARD_PREFIXES[motor_id]}{speed:.3f}\n"
+    return f"{_MOTOR_BACKWARD_PREFIXES[motor_id]}{-speed:.3f}\n"
+
+
+# Legacy motor_left / motor_right map onto the interleaved wheel indices
+# (0=FL, 1=FR, 2=ML, 3=MR, 4=RL, 5=RR), so left is the even indices.
+_LEFT_WHEELS = (0, 2, 4)
+_RIGHT_WHEELS = (1, 3, 5)
+
+
+def _side_lines(motor_ids: tuple[int, ...], speed: float) -> list[str]:
+    """Build MOTOR commands driving every wheel in ``motor_ids`` at one speed."""
+    if speed == 0:
+        return [_MOTOR_STOP_LINES[i] for i in motor_ids]
+    prefixes = _MOTOR_FORWARD_PREFIXES if speed > 0 else _MOTOR_BACKWARD_PREFIXES
+    magnitude = f"{abs(speed):.3f}\n"
+    return [prefixes[i] + magnitude for i in motor_ids]
+
+
+def _servo_line(servo_id: int, angle_deg: float) -> str:
+    """Build the S (servo pulse) command for an angle in degrees."""
+    return f"{_SERVO_PREFIXES[servo_id]}{servo_angle_to_pulse_us(angle_deg)}\n"
+
+
 class MotionDriverBridge:
     """Asynchronous serial bridge to ESP32 MotionDriver.
 
@@ -70,7 +122,13 @@ class MotionDriverBridge:
         self.connected = False
         self._closing = False
         self._supervisor_task: Optional[asyncio.Task] = None
-        self._write_lock = asyncio.Lock()
+
+        # Commands are written straight to the serial fd (see _write_fd); the
+        # StreamWriter only owns the transport, which still handles reads.
+        self._fd: int | None = None
+        self._tx_buf = bytearray()
+        self._tx_drained = asyncio.Event()
+        self._tx_drained.set()
 
         # Debug/telemetry: fan-out of every TX/RX line to the Debug tab, plus
         # heartbeat round-trip tracking derived from the PING/PONG traffic.
@@ -82,6 +140,17 @@ class MotionDriverBridge:
         self._pong_times: deque[float] = deque(maxlen=64)
         self._miss_times: deque[float] = deque(maxlen=64)
 
+        # Last MOTOR / S line sent per wheel, so send_command only transmits
+        # changes. Forgotten whenever the ESP32's state may have diverged.
+        self._last_motor_lines: list[str | None] = [None] * _WHEEL_COUNT
+        self._last_servo_lines: list[str | None] = [None] * _WHEEL_COUNT
+        self._last_full_send_mono = 0.0
+
+    def _forget_sent_commands(self) -> None:
+        """Make the next send_command transmit every wheel's state again."""
+        self._last_motor_lines = [None] * _WHEEL_COUNT
+        self._last_servo_lines = [None] * _WHEEL_COUNT
+
     def _on_tx(self, line: str) -> None:
         """Record an outbound line and track heartbeat timing."""
         self.events.emit({"dir": "tx", "line": line, "ts": _now_ms()})
@@ -103,6 +172,9 @@ class MotionDriverBridge:
             self._last_pong_mono = now
             self._awaiting_pong = False
             self._pong_times.append(now)
+        elif line.startswith("FAILSAFE"):
+            # The firmware deadman stopped the motors behind our back
+            self._forget_sent_commands()
 
     def heartbeat_stats(self) -> dict[str, Any]:
         """Snapshot of link-heartbeat health for the Debug tab."""
@@ -131,7 +203,7 @@ class MotionDriverBridge:
         try:
             await self._open()
         except Exception as e:
-            logger.error(f"Initial MotionDriver connect failed: {e}; will keep retrying")
+            logger.error("Initial MotionDriver connect failed: {}; will keep retrying", e)
             await self._cleanup_transport()
             self.connected = False
         if self._supervisor_task is None:
@@ -139,10 +211,13 @@ class MotionDriverBridge:
 
     async def _open(self) -> None:
         """Open the serial connection and verify it with a PING/PONG handshake."""
-        logger.info(f"Connecting to MotionDriver on {self.port} @ {self.baudrate} baud")
+        logger.info("Connecting to MotionDriver on {} @ {} baud", self.port, self.baudrate)
         self.reader, self.writer = await serial_asyncio.open_serial_connection(
             url=self.port, baudrate=self.baudrate
         )
+        self._enable_low_latency()
+        self._fd = self.writer.transport.serial.fileno()
+        self._forget_sent_commands()
         self.connected = True
         logger.info("MotionDriver connected")
 
@@ -152,10 +227,23 @@ class MotionDriverBridge:
         if response and "PONG" in response:
             logger.success("MotionDriver responded to PING")
         else:
-            logger.warning(f"Unexpected response to PING: {response}")
+            logger.warning("Unexpected response to PING: {}", response)
+
+    def _enable_low_latency(self) -> None:
+        """Ask the tty driver to push received bytes immediately (ASYNC_LOW_LATENCY).
+
+        USB serial adapters otherwise batch reads on a latency timer (16ms on
+        FTDI), which shows up directly in PONG round-trips and command replies.
+        Not every driver supports it, so failure is only logged.
+        """
+        try:
+            self.writer.transport.serial.set_low_latency_mode(True)
+        except (AttributeError, NotImplementedError, ValueError) as e:
+            logger.debug("Serial low-latency mode unavailable on {}: {}", self.port, e)
 
     async def _cleanup_transport(self) -> None:
         """Close and discard the current serial transport, if any."""
+        self._stop_tx()
         writer = self.writer
         self.reader = None
         self.writer = None
@@ -174,7 +262,9 @@ class MotionDriverBridge:
                     await self._open()
                 except Exception as e:
                     logger.warning(
-                        f"MotionDriver reconnect failed: {e}; retrying in {self.reconnect_interval}s"
+                        "MotionDriver reconnect failed: {}; retrying in {}s",
+                        e,
+                        self.reconnect_interval,
                     )
                     await self._cleanup_transport()
                     self.connected = False
@@ -229,19 +319,77 @@ class MotionDriverBridge:
         Args:
             command: Command string (should include newline if required)
         """
-        if not self.writer or not self.connected:
+        # Stops and hand-typed Debug tab lines can change what the motors and
+        # servos are doing, so send_command can no longer skip unchanged wheels.
+        if command.strip().upper() != "PING":
+            self._forget_sent_commands()
+        await self._write_lines([command])
+
+    async def _write_lines(self, commands: list[str]) -> bool:
+        """Write commands in one go. Returns True if they reached the transport."""
+        if not commands:
+            return True
+        if self._fd is None or not self.connected:
             logger.warning("Cannot send command - not connected")
-            return
+            return False
 
         try:
-            async with self._write_lock:
-                self.writer.write(command.encode("utf-8"))
-                await self.writer.drain()
-            logger.debug(f"Sent: {command.strip()}")
-            self._on_tx(command.strip())
+            self._write_fd("".join(commands).encode("utf-8"))
+            for command in commands:
+                line = command.strip()
+                logger.debug("Sent: {}", line)
+                self._on_tx(line)
+            if len(self._tx_buf) > _TX_HIGH_WATER:
+                await self._tx_drained.wait()
+            return True
         except Exception as e:
-            logger.error(f"Failed to send command: {e}")
+            logger.error("Failed to send command: {}", e)
             self.connected = False
+            return False
+
+    def _write_fd(self, data: bytes) -> None:
+        """Write to the serial fd now, buffering whatever the UART can't take yet.
+
+        The StreamWriter would always defer the write to the next loop iteration
+        via add_writer. The tty's kernel buffer nearly always has room for a
+        control tick, so writing immediately is one syscall and no wakeup.
+        Ordering holds because nothing is written directly while data is queued.
+        """
+        if not self._tx_buf:
+            try:
+                written = os.write(self._fd, data)
+            except (BlockingIOError, InterruptedError):
+                written = 0
+            if written == len(data):
+                return
+            data = data[written:]
+            self._tx_drained.clear()
+            asyncio.get_running_loop().add_writer(self._fd, self._flush_tx)
+        self._tx_buf += data
+
+    def _flush_tx(self) -> None:
+        """add_writer callback: push queued bytes as the UART accepts them."""
+        try:
+            written = os.write(self._fd, self._tx_buf)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError as e:
+            logger.error("Failed to write to serial: {}", e)
+            self.connected = False
+            self._stop_tx()
+            return
+        del self._tx_buf[:written]
+        if not self._tx_buf:
+            asyncio.get_running_loop().remove_writer(self._fd)
+            self._tx_drained.set()
+
+    def _stop_tx(self) -> None:
+        """Drop queued output and detach from the fd, releasing any waiting senders."""
+        if self._fd is not None and self._tx_buf:
+            asyncio.get_running_loop().remove_writer(self._fd)
+        self._fd = None
+        self._tx_buf.clear()
+        self._tx_drained.set()
 
     async def read_line(self, timeout: float = 1.0) -> Optional[str]:
         """Read a line from serial port with timeout.
@@ -263,14 +411,14 @@ class MotionDriverBridge:
                 self.connected = False
                 return None
             line = line_bytes.decode("utf-8", errors="ignore").strip()
-            logger.debug(f"Received: {line}")
+            logger.debug("Received: {}", line)
             if line:
                 self._on_rx(line)
             return line
         except asyncio.TimeoutError:
             return None
         except Exception as e:
-            logger.error(f"Failed to read from serial: {e}")
+            logger.error("Failed to read from serial: {}", e)
             self.connected = False
             return None
 
@@ -291,51 +439,56 @@ class MotionDriverBridge:
                 logger.warning("Emergency stop executed")
                 return
 
-            # Motor control - use FORWARD/BACKWARD commands with speed 0.0-1.0
+            now = time.monotonic()
+            if now - self._last_full_send_mono >= COMMAND_REFRESH_INTERVAL_S:
+                self._forget_sent_commands()
+                self._last_full_send_mono = now
+
+            # Collected and sent as one write, so a control tick costs one
+            # syscall and one drain rather than one per wheel. Wheels whose line
+            # matches the last one sent are skipped.
+            lines: list[str] = []
+            last_motor = self._last_motor_lines
+            last_servo = self._last_servo_lines
+
+            def set_motor(motor_id: int, line: str) -> None:
+                if line != last_motor[motor_id]:
+                    last_motor[motor_id] = line
+                    lines.append(line)
+
+            def set_servo(servo_id: int, angle_deg: float) -> None:
+                line = _servo_line(servo_id, angle_deg)
+                if line != last_servo[servo_id]:
+                    last_servo[servo_id] = line
+                    lines.append(line)
+
+            # Motor control - FORWARD/BACKWARD with speed 0.0-1.0, or STOP
             if cmd.motors:
                 for motor_id, speed in enumerate(cmd.motors):
-                    if speed == 0:
-                        await self.send_raw(f"MOTOR {motor_id} STOP\n")
-                    else:
-                        # Determine direction and magnitude
-                        direction = "FORWARD" if speed > 0 else "BACKWARD"
-                        speed_magnitude = abs(speed)  # 0.0 to 1.0
-                        await self.send_raw(f"MOTOR {motor_id} {direction} {speed_magnitude}\n")
+                    set_motor(motor_id, _motor_line(motor_id, speed))
 
             # Servo control - command carries degrees, firmware wants microseconds
             if cmd.servos:
                 for servo_id, angle_deg in enumerate(cmd.servos):
-                    pulse_us = servo_angle_to_pulse_us(angle_deg)
-                    await self.send_raw(f"S {servo_id} {pulse_us}\n")
+                    set_servo(servo_id, angle_deg)
 
             # Legacy command support (backwards compatibility)
             if cmd.motor_left is not None or cmd.motor_right is not None:
-                left = cmd.motor_left or 0.0
-                right = cmd.motor_right or 0.0
-
-                # Map to 6-motor layout. Wheel indices interleave sides
-                # (0=FL, 1=FR, 2=ML, 3=MR, 4=RL, 5=RR), so left is the even indices.
-                for motor_id in [0, 2, 4]:  # Left side
-                    if left == 0:
-                        await self.send_raw(f"MOTOR {motor_id} STOP\n")
-                    else:
-                        direction = "FORWARD" if left > 0 else "BACKWARD"
-                        await self.send_raw(f"MOTOR {motor_id} {direction} {abs(left)}\n")
-
-                for motor_id in [1, 3, 5]:  # Right side
-                    if right == 0:
-                        await self.send_raw(f"MOTOR {motor_id} STOP\n")
-                    else:
-                        direction = "FORWARD" if right > 0 else "BACKWARD"
-                        await self.send_raw(f"MOTOR {motor_id} {direction} {abs(right)}\n")
+                left = _side_lines(_LEFT_WHEELS, cmd.motor_left or 0.0)
+                right = _side_lines(_RIGHT_WHEELS, cmd.motor_right or 0.0)
+                for motor_id, line in zip(_LEFT_WHEELS + _RIGHT_WHEELS, left + right):
+                    set_motor(motor_id, line)
 
             if cmd.servo_pan is not None:
-                await self.send_raw(f"S 0 {servo_angle_to_pulse_us(cmd.servo_pan)}\n")
+                set_servo(0, cmd.servo_pan)
             if cmd.servo_tilt is not None:
-                await self.send_raw(f"S 1 {servo_angle_to_pulse_us(cmd.servo_tilt)}\n")
+                set_servo(1, cmd.servo_tilt)
+
+            if not await self._write_lines(lines):
+                self._forget_sent_commands()
 
         except Exception as e:
-            logger.error(f"Error processing command: {e}")
+            logger.error("Error processing command: {}", e)
 
     def is_connected(self) -> bool:
         """Check if serial connection is active."""
@@ -350,7 +503,7 @@ class MockMotionDriverBridge:
     """
 
     def __init__(self, port: str, baudrate: int = 115200) -> None:
-        logger.info(f"[MOCK] MotionDriver bridge initialized (port={port})")
+        logger.info("[MOCK] MotionDriver bridge initialized (port={})", port)
         self.connected = False
         self.heartbeat_interval = 0.2
         self.events = Broadcaster(history=300)
@@ -389,7 +542,7 @@ class MockMotionDriverBridge:
 
     async def send_raw(self, command: str) -> None:
         line = command.strip()
-        logger.debug(f"[MOCK] Send: {line}")
+        logger.debug("[MOCK] Send: {}", line)
         self.events.emit({"dir": "tx", "line": line, "ts": _now_ms()})
         if line.upper() != "PING":
             reply = "PONG" if line.upper() == "PING" else "OK"
@@ -400,7 +553,7 @@ class MockMotionDriverBridge:
         return "OK"
 
     async def send_command(self, cmd: ControlCommand) -> None:
-        logger.info(f"[MOCK] Command: {cmd.type} | motors={cmd.motors} | servos={cmd.servos}")
+        logger.info("[MOCK] Command: {} | motors={} | servos={}", cmd.type, cmd.motors, cmd.servos)
 
     def heartbeat_stats(self) -> dict[str, Any]:
         now = time.monotonic()
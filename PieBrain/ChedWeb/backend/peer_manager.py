@@ -1,19 +1,60 @@
 """WebRTC peer connection manager with DataChannel support."""
 
 import asyncio
-import json
+import hashlib
+import math
+import struct
 import time
-from typing import Callable, Optional
+from collections.abc import Callable, Coroutine
+from concurrent.futures import Executor
+from typing import Any, Optional
 
+import orjson
 import psutil
 from aiortc import RTCPeerConnection, RTCSessionDescription, RTCDataChannel
 from loguru import logger
 
-from models import ControlCommand, TelemetryData, SystemMetrics
+from models import ControlCommand, TelemetryData
 from camera import PiCameraVideoTrack
 from motion_driver_bridge import MotionDriverBridge
 
 
+def _now_ms() -> int:
+    """Wall-clock time in integer milliseconds, the DataChannel timestamp unit."""
+    return time.time_ns() // 1_000_000
+
+
+def _offer_digest(offer_sdp: str) -> bytes:
+    return hashlib.blake2b(offer_sdp.encode(), digest_size=16).digest()
+
+
+# cpu_percent(interval=None) reports usage since the previous call instead of
+# sleeping for a sample window. Primed here so the first reading isn't 0.
+psutil.cpu_percent(interval=None)
+
+# Only this module's fire-and-forget sends start eagerly (see _spawn). It is not
+# installed as the loop's task factory: aiortc, pyee and uvicorn assume
+# create_task never runs the coroutine before returning. Python 3.12+.
+_eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+
+# Binary ping/pong on the control DataChannel, so the most frequent message skips
+# JSON both ways. One type byte, then little-endian float64s in milliseconds:
+# ping = client timestamp; pong = server timestamp, latency (server - client).
+BINARY_PING = 0x01
+BINARY_PONG = 0x02
+_PING_STRUCT = struct.Struct("<Bd")
+_PONG_STRUCT = struct.Struct("<Bdd")
+
+# System metrics frame, same idea: type byte, then float32 cpu %, memory %,
+# CPU temperature and disk % (NaN when unavailable), then uint64 timestamp ms.
+BINARY_METRICS = 0x10
+_METRICS_STRUCT = struct.Struct("<BffffQ")
+
+# Temperature and disk usage change slowly and are comparatively expensive to
+# read, so the 1 Hz metrics tick refreshes them only this often.
+SLOW_METRICS_INTERVAL_S = 10.0
+
+
 class PeerManager:
     """Manages a WebRTC peer connection with DataChannel for control/telemetry."""
 
@@ -22,44 +63,68 @@ class PeerManager:
         ice_servers: list[dict[str, str | list[str]]],
         video_track: Optional[PiCameraVideoTrack] = None,
         motion_driver: Optional[MotionDriverBridge] = None,
+        executor: Optional[Executor] = None,
     ) -> None:
-        """Initialize peer manager with ICE server configuration."""
+        """Initialize peer manager with ICE server configuration.
+
+        ``executor`` runs blocking system-metrics reads (the loop's default if None).
+        """
         self.ice_servers = ice_servers
         self.video_track = video_track
         self.motion_driver = motion_driver
+        self.executor = executor
         self.pc: RTCPeerConnection | None = None
         self.control_channel: RTCDataChannel | None = None
         self.on_command_callback: Callable[[ControlCommand], None] | None = None
         self.metrics_task: asyncio.Task | None = None
+        # Fire-and-forget serial sends started from DataChannel callbacks. The
+        # event loop only holds weak references to tasks, so keep them here
+        # until they finish or a command could be garbage-collected mid-send.
+        self._background_tasks: set[asyncio.Task] = set()
+        # Last negotiated answer, keyed by a digest of its offer, so a retried
+        # identical offer can reuse it (see cached_answer)
+        self._last_offer_digest: bytes | None = None
+        self._last_answer_sdp: str | None = None
+        self._last_answer_at = 0.0
+        # (cpu_temp, disk_percent), refreshed every SLOW_METRICS_INTERVAL_S
+        self._slow_metrics: tuple[float | None, float | None] = (None, None)
+        self._slow_metrics_at = float("-inf")
 
     def _setup_datachannel(self, channel: RTCDataChannel) -> None:
         """Set up message handlers for the control DataChannel."""
 
         @channel.on("open")
         def on_open() -> None:
-            logger.info(f"DataChannel '{channel.label}' opened")
+            logger.info("DataChannel '{}' opened", channel.label)
             # Send initial telemetry to confirm connection
             self._send_telemetry(
                 TelemetryData(
                     type="telemetry",
-                    timestamp=time.time() * 1000,
+                    timestamp=_now_ms(),
                     battery_voltage=None,  # TODO: Read from sensors
                     current_draw=None,
                     cpu_temp=None,
                     signal_strength=None,
                 )
             )
-            # Start system metrics loop using event loop
-            loop = asyncio.get_event_loop()
-            self.metrics_task = loop.create_task(self._start_metrics_loop())
-            logger.info("System metrics task started")
+            # Start system metrics loop, unless the "already open" path beat us to it
+            if self.metrics_task is None or self.metrics_task.done():
+                self.metrics_task = asyncio.create_task(self._start_metrics_loop())
+                logger.info("System metrics task started")
 
         @channel.on("message")
-        def on_message(message: str) -> None:
+        def on_message(message: str | bytes) -> None:
             """Handle incoming control commands."""
+            if isinstance(message, bytes):
+                if len(message) == _PING_STRUCT.size and message[0] == BINARY_PING:
+                    self._send_binary_pong(_PING_STRUCT.unpack(message)[1])
+                else:
+                    logger.warning("Unknown binary DataChannel message ({} bytes)", len(message))
+                return
+
             try:
-                data = json.loads(message)
-                logger.debug(f"Received message: {data}")
+                data = orjson.loads(message)
+                logger.debug("Received message: {}", data)
 
                 # Handle ping/pong for latency measurement
                 if data.get("type") == "ping":
@@ -67,14 +132,14 @@ class PeerManager:
                     self._send_pong(client_timestamp)
                     return
 
-                # Parse and validate control command
-                command = ControlCommand(**data)
-                logger.info(f"Control command: {command}")
+                # Parse and validate control command. Commands arrive at up to
+                # command_rate_limit_hz, so logging each one is DEBUG-only.
+                command = ControlCommand.model_validate(data)
+                logger.debug("Control command: {}", command)
 
                 # Forward command to MotionDriver via serial bridge
                 if self.motion_driver:
-                    loop = asyncio.get_event_loop()
-                    loop.create_task(self.motion_driver.send_command(command))
+                    self._spawn(self.motion_driver.send_command(command))
                 else:
                     logger.warning("No motion driver connected - command ignored")
 
@@ -82,61 +147,135 @@ class PeerManager:
                 if self.on_command_callback:
                     self.on_command_callback(command)
 
-            except json.JSONDecodeError as e:
-                logger.error(f"Invalid JSON in message: {e}")
+            except orjson.JSONDecodeError as e:
+                logger.error("Invalid JSON in message: {}", e)
             except Exception as e:
-                logger.error(f"Error processing message: {e}")
+                logger.error("Error processing message: {}", e)
 
         @channel.on("close")
         def on_close() -> None:
-            logger.info(f"DataChannel '{channel.label}' closed")
+            logger.info("DataChannel '{}' closed", channel.label)
             # Deadman: the control link just dropped. The firmware deadman only
             # covers Pi->ESP32 silence and the backend keeps sending heartbeats,
             # so we must explicitly stop all motors here.
             if self.motion_driver:
                 logger.warning("Control channel closed - stopping all motors")
-                loop = asyncio.get_event_loop()
-                loop.create_task(self.motion_driver.send_raw("MOTOR ALL STOP\n"))
+                self._spawn(self.motion_driver.send_raw("MOTOR ALL STOP\n"))
 
         # Check if channel is already open and start metrics immediately
         if channel.readyState == "open":
-            logger.info(f"DataChannel '{channel.label}' already open, starting metrics immediately")
+            logger.info(
+                "DataChannel '{}' already open, starting metrics immediately", channel.label
+            )
             on_open()
 
+    def _spawn(self, coro: Coroutine[Any, Any, None]) -> None:
+        """Run ``coro`` as a background task, keeping a reference until it finishes.
+
+        On Python 3.12+ the task starts eagerly, so a serial send that doesn't
+        need to wait goes out before the DataChannel handler returns.
+        """
+        if _eager_task_factory is not None:
+            task = _eager_task_factory(asyncio.get_running_loop(), coro)
+            if task.done():
+                return
+        else:
+            task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
     def _send_pong(self, client_timestamp: float) -> None:
         """Send pong response for latency measurement."""
         if not self.control_channel or self.control_channel.readyState != "open":
             return
 
-        pong = TelemetryData(
-            type="pong",
-            timestamp=time.time() * 1000,
-            latency_ms=time.time() * 1000 - client_timestamp,
-        )
-        self.control_channel.send(pong.model_dump_json())
+        # Per-ping and per-tick messages are plain dicts in the TelemetryData /
+        # SystemMetrics shapes: building and validating a model only to dump it
+        # again costs several times more than encoding the dict with orjson.
+        now_ms = _now_ms()
+        pong = {
+            "type": "pong",
+            "battery_voltage": None,
+            "current_draw": None,
+            "cpu_temp": None,
+            "signal_strength": None,
+            "timestamp": now_ms,
+            "latency_ms": now_ms - client_timestamp,
+        }
+        self._send_json(orjson.dumps(pong).decode())
+
+    def _send_binary_pong(self, client_timestamp: float) -> None:
+        """Answer a binary ping with the server timestamp and measured latency."""
+        channel = self.control_channel
+        if not channel or channel.readyState != "open":
+            return
+
+        # Float, not _now_ms(): the frame is float64 and keeps sub-ms latency
+        now_ms = time.time() * 1000
+        try:
+            channel.send(_PONG_STRUCT.pack(BINARY_PONG, now_ms, now_ms - client_timestamp))
+        except Exception as e:
+            logger.error("Failed to send pong: {}", e)
 
     def _send_telemetry(self, telemetry: TelemetryData) -> None:
         """Send telemetry data to client."""
         if not self.control_channel or self.control_channel.readyState != "open":
             return
 
+        self._send_json(telemetry.model_dump_json())
+
+    def _send_metrics(self, metrics: dict[str, Any]) -> None:
+        """Send system metrics data to client as a binary frame."""
+        channel = self.control_channel
+        if not channel or channel.readyState != "open":
+            return
+
+        cpu_temp = metrics["cpu_temp"]
+        disk_percent = metrics["disk_percent"]
         try:
-            self.control_channel.send(telemetry.model_dump_json())
+            channel.send(
+                _METRICS_STRUCT.pack(
+                    BINARY_METRICS,
+                    metrics["cpu_percent"],
+                    metrics["memory_percent"],
+                    math.nan if cpu_temp is None else cpu_temp,
+                    math.nan if disk_percent is None else disk_percent,
+                    metrics["timestamp"],
+                )
+            )
         except Exception as e:
-            logger.error(f"Failed to send telemetry: {e}")
+            logger.error("Failed to send metrics: {}", e)
 
-    def _send_metrics(self, metrics: SystemMetrics) -> None:
-        """Send system metrics data to client."""
-        if not self.control_channel or self.control_channel.readyState != "open":
+    def _send_json(self, message: str) -> None:
+        """Send a JSON text message on the control channel."""
+        channel = self.control_channel
+        if not channel or channel.readyState != "open":
             return
 
         try:
-            self.control_channel.send(metrics.model_dump_json())
+            channel.send(message)
         except Exception as e:
-            logger.error(f"Failed to send metrics: {e}")
-
-    def _collect_system_metrics(self) -> SystemMetrics:
-        """Collect current system metrics using psutil."""
+            logger.error("Failed to send DataChannel message: {}", e)
+
+    def _collect_system_metrics(self) -> dict[str, Any]:
+        """Collect current system metrics using psutil, shaped like SystemMetrics."""
+        now = time.monotonic()
+        if now - self._slow_metrics_at >= SLOW_METRICS_INTERVAL_S:
+            self._slow_metrics = self._collect_slow_metrics()
+            self._slow_metrics_at = now
+        cpu_temp, disk_percent = self._slow_metrics
+
+        return {
+            "type": "metrics",
+            "cpu_percent": psutil.cpu_percent(interval=None),
+            "memory_percent": psutil.virtual_memory().percent,
+            "cpu_temp": cpu_temp,
+            "disk_percent": disk_percent,
+            "timestamp": _now_ms(),
+        }
+
+    def _collect_slow_metrics(self) -> tuple[float | None, float | None]:
+        """Read CPU temperature and root disk usage, which scan sysfs / statvfs."""
         # Get CPU temperature (Raspberry Pi specific)
         cpu_temp = None
         try:
@@ -144,36 +283,32 @@ class PeerManager:
             if temps and "cpu_thermal" in temps:
                 cpu_temp = temps["cpu_thermal"][0].current
         except Exception as e:
-            logger.debug(f"Could not read CPU temperature: {e}")
+            logger.debug("Could not read CPU temperature: {}", e)
 
         # Get disk usage for root partition
         disk_percent = None
         try:
             disk_percent = psutil.disk_usage("/").percent
         except Exception as e:
-            logger.debug(f"Could not read disk usage: {e}")
+            logger.debug("Could not read disk usage: {}", e)
 
-        return SystemMetrics(
-            type="metrics",
-            cpu_percent=psutil.cpu_percent(interval=0.1),
-            memory_percent=psutil.virtual_memory().percent,
-            cpu_temp=cpu_temp,
-            disk_percent=disk_percent,
-            timestamp=time.time() * 1000,
-        )
+        return cpu_temp, disk_percent
 
     async def _start_metrics_loop(self, interval_seconds: float = 1.0) -> None:
         """Send system metrics at regular intervals via DataChannel."""
-        logger.info(f"Starting system metrics loop (interval={interval_seconds}s)")
+        logger.info("Starting system metrics loop (interval={}s)", interval_seconds)
         try:
             while self.control_channel and self.control_channel.readyState == "open":
-                metrics = self._collect_system_metrics()
+                # Reads several /proc and /sys files, so keep it off the event loop
+                metrics = await asyncio.get_running_loop().run_in_executor(
+                    self.executor, self._collect_system_metrics
+                )
                 self._send_metrics(metrics)
                 await asyncio.sleep(interval_seconds)
         except asyncio.CancelledError:
             logger.info("Metrics loop cancelled")
         except Exception as e:
-            logger.error(f"Error in metrics loop: {e}")
+            logger.error("Error in metrics loop: {}", e)
 
     async def handle_offer(self, offer_sdp: str) -> str:
         """Handle SDP offer and return SDP answer."""
@@ -183,12 +318,12 @@ class PeerManager:
 
             @self.pc.on("connectionstatechange")
             async def on_connectionstatechange() -> None:
-                logger.info(f"Connection state: {self.pc.connectionState}")
+                logger.info("Connection state: {}", self.pc.connectionState)
                 if self.pc.connectionState in ("failed", "disconnected", "closed"):
                     # Lost the peer - estop before any teardown
                     if self.motion_driver:
                         logger.warning(
-                            f"Peer connection {self.pc.connectionState} - stopping all motors"
+                            "Peer connection {} - stopping all motors", self.pc.connectionState
                         )
                         await self.motion_driver.send_raw("MOTOR ALL STOP\n")
                 if self.pc.connectionState == "failed":
@@ -196,7 +331,7 @@ class PeerManager:
 
             @self.pc.on("datachannel")
             def on_datachannel(channel: RTCDataChannel) -> None:
-                logger.info(f"DataChannel created: {channel.label}")
+                logger.info("DataChannel created: {}", channel.label)
                 if channel.label == "control":
                     self.control_channel = channel
                     self._setup_datachannel(channel)
@@ -217,7 +352,32 @@ class PeerManager:
         await self.pc.setLocalDescription(answer)
 
         logger.info("SDP offer/answer exchange completed")
-        return self.pc.localDescription.sdp
+        self._last_offer_digest = _offer_digest(offer_sdp)
+        self._last_answer_sdp = self.pc.localDescription.sdp
+        self._last_answer_at = time.monotonic()
+        return self._last_answer_sdp
+
+    def cached_answer(self, offer_sdp: str, max_age: float) -> str | None:
+        """
+        Return the answer for ``offer_sdp`` if it was negotiated within ``max_age``
+        seconds and its peer connection is still up, else None.
+
+        The answer carries the live connection's ICE credentials and DTLS
+        fingerprint, so it is only reusable while that connection exists.
+        """
+        if (
+            self.pc is None
+            or self._last_answer_sdp is None
+            or time.monotonic() - self._last_answer_at > max_age
+            or _offer_digest(offer_sdp) != self._last_offer_digest
+        ):
+            return None
+        return self._last_answer_sdp
+
+    def active_connections(self) -> int:
+        """Number of live peer connections (0 or 1) for the connections-active gauge."""
+        pc = self.pc
+        return int(pc is not None and pc.connectionState not in ("failed", "closed"))
 
     async def close(self) -> None:
         """Close the peer connection and clean up resources."""
@@ -236,6 +396,9 @@ class PeerManager:
             await self.pc.close()
             self.pc = None
 
+        self._last_offer_digest = None
+        self._last_answer_sdp = None
+
         logger.info("Peer connection closed")
 
     def set_command_callback(self, callback: Callable[[ControlCommand], None]) -> None:
@@ -249,7 +412,7 @@ class PeerManager:
             # TODO: Read actual sensor data
             telemetry = TelemetryData(
                 type="telemetry",
-                timestamp=time.time() * 1000,
+                timestamp=_now_ms(),
                 battery_voltage=None,
                 current_draw=None,
                 cpu_temp=None,
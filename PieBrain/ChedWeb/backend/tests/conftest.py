@@ -1,12 +1,21 @@
 """Pytest configuration and fixtures."""
 
-import pytest
-import asyncio
+from collections.abc import AsyncIterator
 
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create event loop for async tests."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+from main import app
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client() -> AsyncIterator[AsyncClient]:
+    """HTTP client for the app, with its lifespan run once for the whole session.
+
+    Tests using it must run on the session loop too:
+    ``pytestmark = pytest.mark.asyncio(loop_scope="session")``.
+    """
+    lifespan = app.router.lifespan_context(app)
+    transport = ASGITransport(app=app)
+    async with lifespan, AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
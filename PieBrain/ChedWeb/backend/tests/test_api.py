@@ -3,27 +3,25 @@ Basic tests for API endpoints
 """
 
 import pytest
+from aiortc import RTCPeerConnection
 from httpx import AsyncClient
-from main import app
 
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
-@pytest.mark.asyncio
-async def test_health_check():
+
+async def test_health_check(client: AsyncClient) -> None:
     """Test health check endpoint."""
-    async with AsyncClient(app=app, base_url="http://test") as ac:
-        response = await ac.get("/healthz")
+    response = await client.get("/healthz")
     assert response.status_code == 200
     data = response.json()
     assert data["status"] == "ok"
-    assert "timestamp" in data
+    assert data["timestamp"].endswith("+00:00")  # timezone-aware UTC
     assert data["version"] == "0.1.0"
 
 
-@pytest.mark.asyncio
-async def test_get_config():
+async def test_get_config(client: AsyncClient) -> None:
     """Test config endpoint."""
-    async with AsyncClient(app=app, base_url="http://test") as ac:
-        response = await ac.get("/api/config")
+    response = await client.get("/api/config")
     assert response.status_code == 200
     data = response.json()
     assert "version" in data
@@ -31,25 +29,20 @@ async def test_get_config():
     assert "command_rate_limit_hz" in data
 
 
-@pytest.mark.asyncio
-async def test_signaling_offer():
-    """Test signaling offer endpoint with valid SDP."""
-    dummy_sdp = """v=0
-o=- 123 123 IN IP4 127.0.0.1
-s=-
-t=0 0
-a=group:BUNDLE 0
-m=application 9 UDP/DTLS/SCTP webrtc-datachannel
-c=IN IP4 0.0.0.0
-a=ice-ufrag:test
-a=ice-pwd:testpassword
-a=fingerprint:sha-256 00:00:00:00:00:00:00:00:00:00:00:00:00:00:00:00:00:00:00:00:00:00:00:00:00:00:00:00:00:00:00:00
-a=setup:actpass
-a=mid:0
-a=sctp-port:5000
-"""
-    async with AsyncClient(app=app, base_url="http://test") as ac:
-        response = await ac.post("/signaling/offer", json={"sdp": dummy_sdp, "type": "offer"})
+async def test_signaling_offer(client: AsyncClient) -> None:
+    """Test signaling offer endpoint with an offer shaped like the frontend's."""
+    # Built with aiortc rather than hand-written: the backend adds its camera
+    # track, which needs a video section in the offer to answer.
+    pc = RTCPeerConnection()
+    pc.createDataChannel("control")
+    pc.addTransceiver("video", direction="recvonly")
+    await pc.setLocalDescription(await pc.createOffer())
+    try:
+        response = await client.post(
+            "/signaling/offer", json={"sdp": pc.localDescription.sdp, "type": "offer"}
+        )
+    finally:
+        await pc.close()
     assert response.status_code == 200
     data = response.json()
     assert data["type"] == "answer"
@@ -0,0 +1,267 @@
+"""
+Tests for the camera module (mock source, no camera hardware needed)
+"""
+
+import asyncio
+import gc
+import time
+import weakref
+
+import numpy as np
+import pytest
+from av import VideoFrame
+
+import camera
+from camera import (
+    FRAME_POOL_SIZE,
+    MOCK_BAR_COLORS,
+    SETTINGS_DEBOUNCE_S,
+    CameraManager,
+    PiCameraVideoTrack,
+    _plane_views,
+)
+from yuv_convert import LIBYUV_AVAILABLE
+
+
+def _record_track_updates(manager: CameraManager) -> tuple[object, list[dict]]:
+    """Create the manager's track and record settings pushed to it.
+
+    The caller must keep the track referenced: the manager only holds a weakref.
+    """
+    track = manager.create_video_track()
+    updates: list[dict] = []
+    track.update_settings = lambda **kwargs: updates.append(kwargs)
+    return track, updates
+
+
+async def test_settings_updates_are_debounced_into_one_call() -> None:
+    """Updates arriving together reach the running track as one merged call."""
+    manager = CameraManager(framerate=30, awb_mode="auto")
+    track, updates = _record_track_updates(manager)
+
+    manager.update_settings(framerate=15)
+    manager.update_settings(awb_mode="daylight")
+    await asyncio.sleep(SETTINGS_DEBOUNCE_S * 3)
+
+    assert updates == [{"framerate": 15, "awb_mode": "daylight"}]
+    manager.cleanup()
+
+
+async def test_track_swap_on_worker_thread_cancels_pending_update() -> None:
+    """A swap offloaded to a thread cancels the debounce timer on the loop."""
+    manager = CameraManager(framerate=30)
+    track, updates = _record_track_updates(manager)
+
+    manager.update_settings(framerate=15)
+    handle = manager._flush_handle
+    new_track = await asyncio.to_thread(manager.create_video_track)
+    await asyncio.sleep(SETTINGS_DEBOUNCE_S * 3)
+
+    assert handle.cancelled()
+    assert updates == []
+    assert new_track.framerate == 15
+    manager.cleanup()
+
+
+async def test_cleanup_on_worker_thread_cancels_pending_update() -> None:
+    """cleanup() offloaded to a thread cancels the loop's debounce timer via the loop."""
+    manager = CameraManager(framerate=30)
+    track, updates = _record_track_updates(manager)
+
+    manager.update_settings(awb_mode="daylight")
+    handle = manager._flush_handle
+    await asyncio.to_thread(manager.cleanup)
+    assert manager._flush_handle is None
+    await asyncio.sleep(SETTINGS_DEBOUNCE_S * 3)
+
+    assert handle.cancelled()
+    assert updates == []
+
+
+def test_settings_update_without_event_loop_applies_immediately() -> None:
+    """Sync callers have no loop to debounce on, so the update goes straight through."""
+    manager = CameraManager(framerate=30)
+    track, updates = _record_track_updates(manager)
+
+    manager.update_settings(framerate=15)
+
+    assert updates == [{"framerate": 15}]
+    assert manager._flush_handle is None
+    manager.cleanup()
+
+
+async def test_flush_retries_while_a_track_swap_holds_the_lock() -> None:
+    """A flush that finds the track lock busy is re-armed, not dropped for good."""
+    manager = CameraManager(framerate=30)
+    track, updates = _record_track_updates(manager)
+
+    # As if create_video_track were running on a worker thread
+    await asyncio.to_thread(manager._track_lock.acquire)
+    manager.update_settings(framerate=15)
+    await asyncio.sleep(SETTINGS_DEBOUNCE_S * 3)
+    assert updates == []
+
+    manager._track_lock.release()
+    await asyncio.sleep(SETTINGS_DEBOUNCE_S * 3)
+    assert updates == [{"framerate": 15}]
+
+    manager.update_settings(awb_mode="daylight")
+    await asyncio.sleep(SETTINGS_DEBOUNCE_S * 3)
+    assert updates == [{"framerate": 15}, {"awb_mode": "daylight"}]
+    manager.cleanup()
+
+
+async def test_dropped_track_is_freed_without_cyclic_gc() -> None:
+    """A started track must not reference itself, or the camera outlives the peer."""
+    track = PiCameraVideoTrack(width=64, height=48, use_mock=True)
+    await track.recv()
+    track_ref = weakref.ref(track)
+
+    gc.disable()
+    try:
+        del track
+        assert track_ref() is None
+    finally:
+        gc.enable()
+
+
+class _FakeRequest:
+    def __init__(self, array: np.ndarray) -> None:
+        self.array = array
+
+    def release(self) -> None:
+        pass
+
+
+class _FakeMappedArray:
+    """Stands in for picamera2's MappedArray over a _FakeRequest."""
+
+    def __init__(self, request: _FakeRequest, _stream: str) -> None:
+        self.array = request.array
+
+    def __enter__(self) -> "_FakeMappedArray":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        pass
+
+
+class _FakeCamera:
+    """Produces YUV420 buffers whose luma is the capture count (mod 256)."""
+
+    def __init__(self, width: int, height: int) -> None:
+        self.shape = (height * 3 // 2, width)
+        self.captures = 0
+
+    def capture_request(self) -> _FakeRequest:
+        time.sleep(0.001)
+        self.captures += 1
+        return _FakeRequest(np.full(self.shape, self.captures % 256, dtype=np.uint8))
+
+
+def _start_fake_capture(monkeypatch: pytest.MonkeyPatch) -> tuple[PiCameraVideoTrack, _FakeCamera]:
+    """A track running its capture thread against _FakeCamera."""
+    monkeypatch.setattr(camera, "MappedArray", _FakeMappedArray, raising=False)
+    track = PiCameraVideoTrack(width=64, height=48, use_mock=True)
+    track.use_mock = False
+    track._initialized = True
+    track.camera = _FakeCamera(64, 48)
+    track._start_capture_thread()
+    return track, track.camera
+
+
+async def test_capture_recycles_a_fixed_pool_of_frames(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Every frame handed to aiortc comes from the FRAME_POOL_SIZE preallocated ones."""
+    track, _ = _start_fake_capture(monkeypatch)
+    try:
+        frames = [await track.recv() for _ in range(20)]
+    finally:
+        track.stop()
+
+    assert len({id(frame) for frame in frames}) <= FRAME_POOL_SIZE
+
+
+async def test_frame_being_encoded_is_not_overwritten(monkeypatch: pytest.MonkeyPatch) -> None:
+    """While aiortc holds a frame, the capture thread only fills the other slots."""
+    track, fake_camera = _start_fake_capture(monkeypatch)
+    try:
+        frame = await track.recv()
+        luma = frame.to_ndarray()[0, 0]
+        captures = fake_camera.captures
+        # The pool is never exhausted: captures continue while recv() is idle
+        for _ in range(200):
+            if fake_camera.captures >= captures + 3 * FRAME_POOL_SIZE:
+                break
+            await asyncio.sleep(0.005)
+        assert fake_camera.captures >= captures + 3 * FRAME_POOL_SIZE
+        assert frame.to_ndarray()[0, 0] == luma
+
+        newer = await track.recv()
+        assert newer.to_ndarray()[0, 0] != luma
+    finally:
+        track.stop()
+
+
+def test_yuv420_split_ignores_stride_padding() -> None:
+    """A padded picamera2 YUV420 buffer lands in the right planes, minus padding."""
+    width, height, stride = 64, 48, 96
+    track = PiCameraVideoTrack(width=width, height=height, use_mock=True)
+    y = np.arange(height * width, dtype=np.uint8).reshape(height, width)
+    u = np.full((height // 2, width // 2), 100, dtype=np.uint8)
+    v = np.full((height // 2, width // 2), 200, dtype=np.uint8)
+    # Y rows at the full stride, then U and V at half stride, padding set to 255
+    buffer = np.full((height * 3 // 2, stride), 255, dtype=np.uint8)
+    buffer[:height, :width] = y
+    chroma = buffer[height:].reshape(-1)
+    half = (height // 2) * (stride // 2)
+    chroma[:half].reshape(height // 2, stride // 2)[:, : width // 2] = u
+    chroma[half:].reshape(height // 2, stride // 2)[:, : width // 2] = v
+
+    frame = VideoFrame(width, height, "yuv420p")
+    track._copy_yuv420(buffer, _plane_views(frame))
+
+    expected = np.concatenate([y, u.reshape(-1, width), v.reshape(-1, width)])
+    np.testing.assert_array_equal(frame.to_ndarray(), expected)
+
+
+def test_mock_frame_is_yuv420_colour_bars() -> None:
+    """The mock pattern is native yuv420p with the eight bars in order."""
+    track = PiCameraVideoTrack(width=160, height=96, use_mock=True)
+    frame = track._build_mock_frame()
+    assert frame.format.name == "yuv420p"
+
+    # Sample the middle of each bar below the grey counter box
+    rgb = frame.to_ndarray(format="rgb24")[80]
+    bar_width = 160 // len(MOCK_BAR_COLORS)
+    for index, color in enumerate(MOCK_BAR_COLORS):
+        sampled = rgb[index * bar_width + bar_width // 2]
+        assert np.abs(sampled.astype(int) - color).max() <= 8, (index, sampled)
+
+
+def test_bgr_fallback_copies_rows_into_frame() -> None:
+    """Without YUV420 output, RGB888 (BGR bytes) buffers are copied into bgr24 frames."""
+    width, height = 64, 48
+    track = PiCameraVideoTrack(width=width, height=height, use_mock=True)
+    bgr = np.random.default_rng(0).integers(0, 256, (height, width, 3), dtype=np.uint8)
+
+    frame = VideoFrame(width, height, "bgr24")
+    track._copy_bgr24(bgr, _plane_views(frame))
+
+    np.testing.assert_array_equal(frame.to_ndarray(), bgr)
+
+
+@pytest.mark.skipif(not LIBYUV_AVAILABLE, reason="libyuv not installed")
+def test_bgr_fallback_converts_to_yuv420_with_libyuv() -> None:
+    """With libyuv, RGB888 buffers are converted to yuv420p matching PyAV's result."""
+    width, height = 64, 48
+    track = PiCameraVideoTrack(width=width, height=height, use_mock=True)
+    bgr = np.zeros((height, width, 3), dtype=np.uint8)
+    bgr[:, : width // 2] = (255, 0, 0)  # blue left half
+    bgr[:, width // 2 :] = (0, 0, 255)  # red right half
+
+    frame = VideoFrame(width, height, "yuv420p")
+    track._convert_bgr24(bgr, _plane_views(frame))
+
+    reference = VideoFrame.from_ndarray(bgr, format="bgr24").reformat(format="yuv420p")
+    diff = frame.to_ndarray().astype(int) - reference.to_ndarray().astype(int)
+    assert np.abs(diff).max() <= 2
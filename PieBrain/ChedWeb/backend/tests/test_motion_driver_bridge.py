@@ -2,33 +2,39 @@
 Tests for the MotionDriver serial bridge
 """
 
+import os
+from types import SimpleNamespace
+
+import motion_driver_bridge
 import pytest
+from models import ControlCommand
 from motion_driver_bridge import (
     SERVO_MAX_PULSE_US,
     SERVO_MIN_PULSE_US,
+    MotionDriverBridge,
     servo_angle_to_pulse_us,
 )
 
 
-def test_centre_angle_maps_to_centre_pulse():
+def test_centre_angle_maps_to_centre_pulse() -> None:
     """90 degrees (straight ahead) must land on 1500us."""
     assert servo_angle_to_pulse_us(90) == 1500
 
 
-def test_endpoints_map_to_firmware_clamp_range():
+def test_endpoints_map_to_firmware_clamp_range() -> None:
     """The 0-180 degree range must span exactly the firmware's pulse range."""
     assert servo_angle_to_pulse_us(0) == SERVO_MIN_PULSE_US
     assert servo_angle_to_pulse_us(180) == SERVO_MAX_PULSE_US
 
 
-def test_out_of_range_angles_are_clamped():
+def test_out_of_range_angles_are_clamped() -> None:
     """Angles outside 0-180 clamp rather than producing wild pulse widths."""
     assert servo_angle_to_pulse_us(-30) == SERVO_MIN_PULSE_US
     assert servo_angle_to_pulse_us(400) == SERVO_MAX_PULSE_US
 
 
 @pytest.mark.parametrize("angle", [0, 45, 90, 135, 180])
-def test_all_angles_land_inside_firmware_clamp_range(angle):
+def test_all_angles_land_inside_firmware_clamp_range(angle: int) -> None:
     """Regression: degrees were once passed straight through as microseconds.
 
     Every angle then fell below the firmware's 1000us floor, so all six servos
@@ -37,8 +43,92 @@ def test_all_angles_land_inside_firmware_clamp_range(angle):
     assert SERVO_MIN_PULSE_US <= servo_angle_to_pulse_us(angle) <= SERVO_MAX_PULSE_US
 
 
-def test_steering_extremes_are_distinguishable():
+def test_steering_extremes_are_distinguishable() -> None:
     """Ackermann's +/-45 degrees must produce distinct pulses either side of centre."""
     left = servo_angle_to_pulse_us(45)
     right = servo_angle_to_pulse_us(135)
     assert left < 1500 < right
+
+
+@pytest.fixture
+def bridge(monkeypatch: pytest.MonkeyPatch) -> MotionDriverBridge:
+    """A connected bridge whose direct fd writes are recorded instead of sent."""
+    writes: list[bytes] = []
+
+    def record_write(_fd: int, data: bytes) -> int:
+        writes.append(bytes(data))
+        return len(data)
+
+    monkeypatch.setattr(motion_driver_bridge, "os", SimpleNamespace(write=record_write))
+    bridge = MotionDriverBridge(port="/dev/null")
+    bridge._fd = -1
+    bridge.connected = True
+    bridge.writes = writes
+    return bridge
+
+
+async def test_send_command_batches_one_write_per_tick(bridge: MotionDriverBridge) -> None:
+    """A full 6-motor + 6-servo command goes out as a single serial write."""
+    await bridge.send_command(
+        ControlCommand(
+            type="motor",
+            motors=[0.5, -0.5, 0.0, 0.0, 1.0, -1.0],
+            servos=[90] * 6,
+            timestamp=0,
+        )
+    )
+
+    assert len(bridge.writes) == 1
+    lines = bridge.writes[0].decode().splitlines()
+    assert lines[:3] == ["MOTOR 0 FORWARD 0.500", "MOTOR 1 BACKWARD 0.500", "MOTOR 2 STOP"]
+    assert lines[6:] == [f"S {i} 1500" for i in range(6)]
+
+
+async def test_send_command_skips_unchanged_wheels_until_a_stop(bridge: MotionDriverBridge) -> None:
+    """Repeated identical commands only send what changed; a stop resets that."""
+    cmd = ControlCommand(type="motor", motors=[0.5] * 6, timestamp=0)
+
+    await bridge.send_command(cmd)
+    await bridge.send_command(cmd)
+    await bridge.send_command(cmd.model_copy(update={"motors": [0.5] * 5 + [0.25]}))
+    assert [w.decode() for w in bridge.writes[1:]] == ["MOTOR 5 FORWARD 0.250\n"]
+
+    await bridge.send_command(ControlCommand(type="stop", timestamp=0))
+    await bridge.send_command(cmd)
+    assert len(bridge.writes[-1].decode().splitlines()) == 6
+
+
+async def test_legacy_left_right_drive_even_and_odd_wheels(bridge: MotionDriverBridge) -> None:
+    """motor_left drives the even (left) wheels, motor_right the odd (right) ones."""
+    await bridge.send_command(
+        ControlCommand(type="motor", motor_left=0.5, motor_right=-0.25, timestamp=0)
+    )
+
+    assert bridge.writes[0].decode().splitlines() == [
+        "MOTOR 0 FORWARD 0.500",
+        "MOTOR 2 FORWARD 0.500",
+        "MOTOR 4 FORWARD 0.500",
+        "MOTOR 1 BACKWARD 0.250",
+        "MOTOR 3 BACKWARD 0.250",
+        "MOTOR 5 BACKWARD 0.250",
+    ]
+
+
+async def test_partial_write_queues_the_rest_in_order(
+    bridge: MotionDriverBridge, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """What the UART can't take now waits for the fd writer, ahead of newer lines."""
+    accepted = iter([4])
+    monkeypatch.setattr(
+        motion_driver_bridge, "os", SimpleNamespace(write=lambda _fd, _data: next(accepted))
+    )
+    read_fd, bridge._fd = os.pipe()
+    try:
+        assert await bridge._write_lines(["PING\n"])
+        assert await bridge._write_lines(["STATUS\n"])
+        assert bytes(bridge._tx_buf) == b"\nSTATUS\n"
+    finally:
+        write_fd = bridge._fd
+        bridge._stop_tx()
+        os.close(read_fd)
+        os.close(write_fd)
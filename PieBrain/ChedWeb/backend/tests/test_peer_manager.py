@@ -2,11 +2,16 @@
 Tests for peer manager (unit tests, WebRTC mocked)
 """
 
+import asyncio
+import math
+import struct
+import time
+
 import pytest
-from peer_manager import PeerManager
+from peer_manager import BINARY_METRICS, BINARY_PONG, PeerManager
 
 
-def test_peer_manager_init():
+def test_peer_manager_init() -> None:
     """Test peer manager initialization."""
     manager = PeerManager(ice_servers=[{"urls": ["stun:stun.l.google.com:19302"]}])
     assert manager.pc is None
@@ -14,7 +19,7 @@ def test_peer_manager_init():
 
 
 @pytest.mark.asyncio
-async def test_handle_offer_creates_peer_connection():
+async def test_handle_offer_creates_peer_connection() -> None:
     """Test that handle_offer creates a peer connection."""
     manager = PeerManager(ice_servers=[{"urls": ["stun:stun.l.google.com:19302"]}])
 
@@ -42,6 +47,97 @@ a=sctp-port:5000
     await manager.close()
 
 
+class _RecordingChannel:
+    """Stands in for an open RTCDataChannel, recording sent messages."""
+
+    readyState = "open"  # noqa: N815 - mirrors aiortc's attribute name
+
+    def __init__(self) -> None:
+        self.sent: list[bytes | str] = []
+
+    def send(self, message: bytes | str) -> None:
+        self.sent.append(message)
+
+
+def test_binary_pong_reports_latency() -> None:
+    """A binary pong carries the server time and the latency since the ping."""
+    manager = PeerManager(ice_servers=[])
+    manager.control_channel = _RecordingChannel()
+
+    client_ms = time.time() * 1000 - 25
+    manager._send_binary_pong(client_ms)
+
+    (pong,) = manager.control_channel.sent
+    kind, server_ms, latency_ms = struct.unpack("<Bdd", pong)
+    assert kind == BINARY_PONG
+    assert latency_ms == pytest.approx(server_ms - client_ms)
+    assert latency_ms >= 25
+
+
+def test_binary_metrics_frame_uses_nan_for_missing_readings() -> None:
+    """Metrics go out as one fixed-size frame; missing sensors become NaN."""
+    manager = PeerManager(ice_servers=[])
+    manager.control_channel = _RecordingChannel()
+
+    manager._send_metrics(
+        {
+            "type": "metrics",
+            "cpu_percent": 12.5,
+            "memory_percent": 40.0,
+            "cpu_temp": None,
+            "disk_percent": 55.0,
+            "timestamp": 1_700_000_000_123,
+        }
+    )
+
+    (frame,) = manager.control_channel.sent
+    kind, cpu, mem, temp, disk, ts = struct.unpack("<BffffQ", frame)
+    assert kind == BINARY_METRICS
+    assert (cpu, mem, disk, ts) == (12.5, 40.0, 55.0, 1_700_000_000_123)
+    assert math.isnan(temp)
+
+
+async def test_spawn_keeps_task_until_done() -> None:
+    """Background sends stay referenced while pending and are dropped after."""
+    manager = PeerManager(ice_servers=[])
+    release = asyncio.Event()
+
+    async def send() -> None:
+        await release.wait()
+
+    manager._spawn(send())
+    assert len(manager._background_tasks) == 1
+
+    release.set()
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert not manager._background_tasks
+
+
+@pytest.mark.skipif(
+    not hasattr(asyncio, "eager_task_factory"), reason="eager tasks need Python 3.12+"
+)
+async def test_spawn_runs_eagerly_without_changing_the_loop_factory() -> None:
+    """_spawn starts its own task inline; other tasks on the loop stay lazy."""
+    manager = PeerManager(ice_servers=[])
+    ran = []
+
+    async def send() -> None:
+        ran.append("spawned")
+
+    manager._spawn(send())
+    assert ran == ["spawned"]
+    assert not manager._background_tasks
+
+    async def other() -> None:
+        ran.append("other")
+
+    task = asyncio.create_task(other())
+    assert ran == ["spawned"]
+    await task
+    assert asyncio.get_running_loop().get_task_factory() is None
+
+
 # TODO: Add more comprehensive tests with mocked WebRTC components
 # TODO: Test DataChannel message handling
 # TODO: Test command callbacks
@@ -0,0 +1,76 @@
+"""Optional libyuv binding for fast RGB to I420 (yuv420p) conversion.
+
+Only used when the camera can't be configured for native YUV420 output. libyuv
+uses NEON on the Pi's Cortex-A53, which is several times faster than any
+NumPy colour-space conversion. If the shared library isn't installed
+(``sudo apt install libyuv0``), ``LIBYUV_AVAILABLE`` is False and callers
+should fall back to handing RGB frames to the encoder.
+"""
+
+import ctypes
+import ctypes.util
+from typing import Optional
+
+import numpy as np
+from loguru import logger
+
+
+def _load_libyuv() -> Optional[ctypes.CDLL]:
+    """Locate libyuv and declare the conversion signatures we use."""
+    path = ctypes.util.find_library("yuv")
+    if path is None:
+        return None
+    try:
+        lib = ctypes.CDLL(path)
+    except OSError as e:
+        logger.warning(f"Found libyuv at {path} but could not load it: {e}")
+        return None
+
+    # int RGB24ToI420(const uint8_t* src_rgb24, int src_stride_rgb24,
+    #                 uint8_t* dst_y, int dst_stride_y,
+    #                 uint8_t* dst_u, int dst_stride_u,
+    #                 uint8_t* dst_v, int dst_stride_v,
+    #                 int width, int height);
+    lib.RGB24ToI420.argtypes = [ctypes.c_void_p, ctypes.c_int] * 4 + [ctypes.c_int] * 2
+    lib.RGB24ToI420.restype = ctypes.c_int
+    return lib
+
+
+_libyuv = _load_libyuv()
+LIBYUV_AVAILABLE = _libyuv is not None
+
+
+def bgr24_to_i420(
+    src: np.ndarray, y: np.ndarray, u: np.ndarray, v: np.ndarray, width: int, height: int
+) -> None:
+    """
+    Convert a BGR-ordered image into I420 planes in place.
+
+    libyuv names formats by little-endian word order, so its "RGB24" is B, G, R
+    in memory - the same layout picamera2 calls RGB888.
+
+    Args:
+        src: ``(height, width, 3)`` uint8 image; rows may be strided
+        y: Destination Y plane, ``(height, stride)``
+        u: Destination U plane, ``(height / 2, stride)``
+        v: Destination V plane, ``(height / 2, stride)``
+        width: Image width in pixels
+        height: Image height in pixels
+    """
+    if _libyuv is None:
+        raise RuntimeError("libyuv is not available")
+
+    result = _libyuv.RGB24ToI420(
+        src.ctypes.data,
+        src.strides[0],
+        y.ctypes.data,
+        y.strides[0],
+        u.ctypes.data,
+        u.strides[0],
+        v.ctypes.data,
+        v.strides[0],
+        width,
+        height,
+    )
+    if result != 0:
+        raise RuntimeError(f"libyuv RGB24ToI420 failed with code {result}")
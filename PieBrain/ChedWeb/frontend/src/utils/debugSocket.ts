@@ -91,6 +91,14 @@ export class DebugSocket {
 
   private dispatch(msg: { type?: string } & Record<string, unknown>): void {
     switch (msg.type) {
+      case 'batch': {
+        // The backend coalesces queued events into one frame under load
+        const messages: unknown[] = Array.isArray(msg.messages) ? msg.messages : []
+        for (const m of messages) {
+          this.dispatch(m as { type?: string } & Record<string, unknown>)
+        }
+        break
+      }
       case 'snapshot': {
         this.callbacks.onSnapshot?.({
           serial: SerialEventSchema.array().catch([]).parse(msg.serial ?? []),
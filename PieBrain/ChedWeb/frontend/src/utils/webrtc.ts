@@ -21,6 +21,20 @@ const getApiBase = (): string => {
 
 const API_BASE = getApiBase()
 
+// Binary ping/pong framing on the control DataChannel (mirrors peer_manager.py):
+// one type byte, then little-endian float64 milliseconds.
+// ping = client timestamp; pong = server timestamp, latency (server - client).
+const BINARY_PING = 0x01
+const BINARY_PONG = 0x02
+const PING_BYTES = 9
+const PONG_BYTES = 17
+// System metrics frame: type byte, float32 cpu %, memory %, CPU temp, disk %
+// (NaN when unavailable), uint64 timestamp ms
+const BINARY_METRICS = 0x10
+const METRICS_BYTES = 25
+
+const nanToNull = (value: number): number | null => (Number.isNaN(value) ? null : value)
+
 /**
  * Get the API base URL for making requests
  * Use this in components that need to make API calls
@@ -101,6 +115,9 @@ export class WebRTCManager {
   private setupDataChannel(): void {
     if (!this.dataChannel) return
 
+    // Deliver binary messages (pongs) as ArrayBuffer rather than Blob
+    this.dataChannel.binaryType = 'arraybuffer'
+
     this.dataChannel.onopen = () => {
       console.log('DataChannel opened')
       // Send initial ping to measure latency
@@ -108,17 +125,12 @@ export class WebRTCManager {
     }
 
     this.dataChannel.onmessage = event => {
+      if (event.data instanceof ArrayBuffer) {
+        this.handleBinaryMessage(event.data)
+        return
+      }
       try {
-        const data = JSON.parse(event.data)
-        
-        // Parse as system metrics
-        const metricsResult = SystemMetricsSchema.safeParse(data)
-        if (metricsResult.success) {
-          this.callbacks.onSystemMetrics?.(metricsResult.data)
-          return
-        }
-
-        console.warn('Received unknown DataChannel message type:', data)
+        this.handleDataChannelMessage(JSON.parse(event.data))
       } catch (error) {
         console.error('Failed to parse DataChannel message:', error)
       }
@@ -134,6 +146,38 @@ export class WebRTCManager {
     }
   }
 
+  private handleBinaryMessage(buffer: ArrayBuffer): void {
+    const view = new DataView(buffer)
+    const type = view.getUint8(0)
+    if (buffer.byteLength === METRICS_BYTES && type === BINARY_METRICS) {
+      this.callbacks.onSystemMetrics?.({
+        type: 'metrics',
+        cpu_percent: view.getFloat32(1, true),
+        memory_percent: view.getFloat32(5, true),
+        cpu_temp: nanToNull(view.getFloat32(9, true)),
+        disk_percent: nanToNull(view.getFloat32(13, true)),
+        timestamp: Number(view.getBigUint64(17, true)),
+      })
+      return
+    }
+    if (buffer.byteLength === PONG_BYTES && type === BINARY_PONG) {
+      // Nothing displays link latency yet; the reply only confirms the channel
+      return
+    }
+    console.warn('Received unknown binary DataChannel message:', buffer.byteLength, 'bytes')
+  }
+
+  private handleDataChannelMessage(data: unknown): void {
+    // Parse as system metrics
+    const metricsResult = SystemMetricsSchema.safeParse(data)
+    if (metricsResult.success) {
+      this.callbacks.onSystemMetrics?.(metricsResult.data)
+      return
+    }
+
+    console.warn('Received unknown DataChannel message type:', data)
+  }
+
   sendCommand(command: Omit<ControlCommand, 'timestamp'>): void {
     if (!this.dataChannel || this.dataChannel.readyState !== 'open') {
       console.warn('DataChannel not ready, command not sent')
@@ -153,12 +197,10 @@ export class WebRTCManager {
       return
     }
 
-    this.dataChannel.send(
-      JSON.stringify({
-        type: 'ping',
-        timestamp: Date.now(),
-      })
-    )
+    const ping = new DataView(new ArrayBuffer(PING_BYTES))
+    ping.setUint8(0, BINARY_PING)
+    ping.setFloat64(1, Date.now(), true)
+    this.dataChannel.send(ping.buffer)
   }
 
   async disconnect(): Promise<void> {
@@ -1,6 +1,6 @@
 import os
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
 
 
 def _as_bool(value: Optional[str], default: bool = False) -> bool:
@@ -9,21 +9,28 @@ def _as_bool(value: Optional[str], default: bool = False) -> bool:
     return value.strip().lower() in {"1", "true", "yes", "on"}
 
 
+def _env(name: str, default: str, parse: Callable[[str], Any] = str) -> Any:
+    """Field default read from the environment when the config is created.
+
+    Reading in a default_factory (not at class definition) means env vars set
+    after this module is imported, e.g. by tests or a launcher, still apply.
+    """
+    return field(default_factory=lambda: parse(os.getenv(name, default)))
+
+
 @dataclass(frozen=True)
 class SerialConfig:
     """Runtime configuration for the MotionDriver serial link."""
 
-    port: str = os.getenv("MOTIONDRIVER_SERIAL_PORT", "auto")
-    baudrate: int = int(os.getenv("MOTIONDRIVER_SERIAL_BAUDRATE", "115200"))
-    timeout: float = float(os.getenv("MOTIONDRIVER_SERIAL_TIMEOUT", "1.0"))
+    port: str = _env("MOTIONDRIVER_SERIAL_PORT", "auto")
+    baudrate: int = _env("MOTIONDRIVER_SERIAL_BAUDRATE", "115200", int)
+    timeout: float = _env("MOTIONDRIVER_SERIAL_TIMEOUT", "1.0", float)
     # Background PING cadence that keeps the firmware deadman fed. Must stay
     # well under the ESP32's deadman window (1.0s) so a healthy link keeps the
     # motors enabled. Set to 0 (or below) to disable the heartbeat entirely.
-    heartbeat_interval: float = float(
-        os.getenv("MOTIONDRIVER_HEARTBEAT_INTERVAL", "0.2")
-    )
-    dry_run: bool = _as_bool(os.getenv("MOTIONDRIVER_DRY_RUN"), default=False)
-    log_traffic: bool = _as_bool(os.getenv("MOTIONDRIVER_LOG_TRAFFIC"), default=True)
+    heartbeat_interval: float = _env("MOTIONDRIVER_HEARTBEAT_INTERVAL", "0.2", float)
+    dry_run: bool = _env("MOTIONDRIVER_DRY_RUN", "false", _as_bool)
+    log_traffic: bool = _env("MOTIONDRIVER_LOG_TRAFFIC", "true", _as_bool)
 
     def effective_port(self) -> Optional[str]:
         """Return the port string, resolving the "auto" sentinel to None."""
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import logging
+import os
+import select
 import threading
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional, Protocol
 
 from config import SerialConfig
@@ -15,6 +18,8 @@ except ImportError:  # pragma: no cover - handled in tests
 
 _LOGGER = logging.getLogger(__name__)
 
+_OK_LINES = frozenset((b"OK\r\n", b"OK\n"))
+
 
 class CommandError(RuntimeError):
     """Raised when the MotionDriver returns an error response."""
@@ -37,11 +42,28 @@ class PySerialTransport:
         if serial is None:  # pragma: no cover - import fallback
             raise RuntimeError("pyserial is required but not installed")
         self._serial = serial.Serial(port=port, baudrate=baudrate, timeout=timeout)
+        # POSIX ports are written directly; pyserial's Windows backend has no fd.
+        self._fd: Optional[int]
+        try:
+            self._fd = self._serial.fileno()
+        except OSError:  # pragma: no cover - io.UnsupportedOperation on Windows
+            self._fd = None
 
     def write_line(self, line: str) -> None:
         payload = (line.rstrip("\r\n") + "\n").encode("utf-8")
-        self._serial.write(payload)
-        self._serial.flush()
+        if self._fd is None:  # pragma: no cover - Windows
+            self._serial.write(payload)
+            return
+        # Serial.write() adds a select() round-trip to every write, and flush()
+        # would tcdrain() until the UART has shifted out the last bit -- a few
+        # ms per command at 115200 baud. The reply is awaited by readline()
+        # anyway, so handing the bytes to the kernel is enough.
+        view = memoryview(payload)
+        while view:
+            try:
+                view = view[os.write(self._fd, view) :]
+            except BlockingIOError:
+                select.select([], [self._fd], [])
 
     def readline(self, timeout: float) -> Optional[str]:
         original_timeout = self._serial.timeout
@@ -52,6 +74,9 @@ class PySerialTransport:
             self._serial.timeout = original_timeout
         if not raw:
             return None
+        # Nearly every reply is a bare ack (println -> "OK\r\n"); skip decoding it.
+        if raw in _OK_LINES:
+            return "OK"
         return raw.decode("utf-8", errors="replace").strip()
 
     def close(self) -> None:
@@ -145,10 +170,11 @@ class SerialBridge:
                 raise TimeoutError(
                     f"No response received for command '{command}' within {timeout}s"
                 )
-            response = response.strip()
+            if response != "OK":
+                response = response.strip()
             if log:
                 _LOGGER.info("<- %s", response)
-            if response.upper().startswith("ERR"):
+            if response[:3].upper() == "ERR":
                 raise CommandError(response)
             return response
 
@@ -177,11 +203,12 @@ class SerialBridge:
     ) -> str:
         tgt = self._normalize_target(target)
         dir_upper = self._normalize_direction(direction)
-        command = f"MOTOR {tgt} {dir_upper}"
-        if speed is not None:
-            if not 0.0 <= speed <= 1.0:
-                raise ValueError("speed must be between 0.0 and 1.0")
-            command += f" {speed:.2f}"
+        if speed is None:
+            command = f"MOTOR {tgt} {dir_upper}"
+        elif 0.0 <= speed <= 1.0:
+            command = f"MOTOR {tgt} {dir_upper} {speed:.2f}"
+        else:
+            raise ValueError("speed must be between 0.0 and 1.0")
         return self._expect_ok(self.send_command(command))
 
     def motor_start(self, target: str) -> str:
@@ -205,7 +232,10 @@ class SerialBridge:
         if channel < 0 or channel > 15:
             raise ValueError("channel must be between 0 and 15 (inclusive)")
 
+    # Only a handful of spellings ever reach these ("0".."5", "ALL", "forward"),
+    # so results are cached; invalid input raises and is never cached.
     @staticmethod
+    @lru_cache(maxsize=16)
     def _normalize_target(target: str) -> str:
         target = str(target).strip().upper()
         if target in {"ALL", "[ALL]"}:
@@ -218,6 +248,7 @@ class SerialBridge:
         return str(index)
 
     @staticmethod
+    @lru_cache(maxsize=16)
     def _normalize_direction(direction: str) -> str:
         upper = direction.strip().upper()
         if upper not in {"FORWARD", "BACKWARD"}:
@@ -1,3 +1,5 @@
+import os
+
 import pytest
 
 from ..config import SerialConfig
@@ -40,3 +42,26 @@ def test_error_response_raises_command_error() -> None:
 def test_ping_returns_response() -> None:
     bridge, _ = make_bridge("PONG")
     assert bridge.ping() == "PONG"
+
+
+def test_pyserial_transport_writes_line_to_port() -> None:
+    pty = pytest.importorskip("pty")
+    from ..serial_bridge import PySerialTransport
+
+    controller, device = pty.openpty()
+    transport = PySerialTransport(os.ttyname(device), 115200, 0.1)
+    try:
+        transport.write_line("MOTOR ALL STOP\r\n")
+        assert os.read(controller, 64) == b"MOTOR ALL STOP\n"
+    finally:
+        transport.close()
+        os.close(controller)
+        os.close(device)
+
+
+def test_config_reads_environment_at_creation(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("MOTIONDRIVER_SERIAL_BAUDRATE", "57600")
+    monkeypatch.setenv("MOTIONDRIVER_DRY_RUN", "yes")
+    config = SerialConfig()
+    assert config.baudrate == 57600
+    assert config.dry_run is True